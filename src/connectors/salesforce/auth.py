@@ -5,6 +5,8 @@ Handles authentication logic for Salesforce API connections.
 """
 
 from typing import Optional, Tuple
+
+import requests
 from simple_salesforce import Salesforce, SalesforceAuthenticationFailed
 from simple_salesforce.exceptions import SalesforceGeneralError
 
@@ -24,12 +26,15 @@ class SalesforceAuthenticator:
     """Handles Salesforce authentication."""
 
     @staticmethod
-    def authenticate(credentials: SalesforceCredentials) -> Tuple[Optional[Salesforce], Optional[str]]:
+    def authenticate(credentials: SalesforceCredentials,
+                     session: Optional[requests.Session] = None) -> Tuple[Optional[Salesforce], Optional[str]]:
         """
         Authenticate with Salesforce using username, password, and security token.
 
         Args:
             credentials: SalesforceCredentials object
+            session: Optional persistent requests.Session; reusing one across
+                attempts skips the TLS handshake on retries
 
         Returns:
             Tuple of (Salesforce instance, error_message)
@@ -62,7 +67,8 @@ class SalesforceAuthenticator:
                 username=credentials.username,
                 password=credentials.password,
                 security_token=credentials.security_token,
-                domain=domain
+                domain=domain,
+                session=session
             )
 
             logger.info(f"Successfully authenticated user: {credentials.username}")
@@ -13,6 +13,19 @@ from typing import Any, Dict, Optional, List
 from simple_salesforce import Salesforce
 from simple_salesforce.exceptions import SalesforceExpiredSession
 
+# orjson decodes Salesforce REST payloads several times faster than the
+# stdlib; fall back silently when it is not installed
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
 from ..base import BaseConnector
 from ...core.logging_config import get_logger
 from ...core.credentials import SalesforceCredentials
@@ -40,6 +53,19 @@ class SalesforceClient(BaseConnector):
         self._credentials: Optional[SalesforceCredentials] = None
         self._lock = threading.Lock()
 
+        # Persistent HTTP session shared by the auth flow and every direct
+        # REST/Tooling/Bulk call below: keep-alive skips the ~100-200ms TLS
+        # handshake per request, and the pool is sized so the presenter's
+        # concurrent worker threads each get a reusable connection instead
+        # of serializing on a tiny pool
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+
+        # Parsed field lists per layout ID: re-clicking a layout reuses
+        # the result instead of re-walking the raw layout JSON
+        self._layout_fields_by_id: Dict[str, List[str]] = {}
+
     def connect(self, credentials: SalesforceCredentials) -> bool:
         """
         Establish connection to Salesforce.
@@ -60,8 +86,10 @@ class SalesforceClient(BaseConnector):
                 # Store credentials for potential reconnection
                 self._credentials = credentials
 
-                # Authenticate
-                sf_instance, error = SalesforceAuthenticator.authenticate(credentials)
+                # Authenticate (reusing the persistent session)
+                sf_instance, error = SalesforceAuthenticator.authenticate(
+                    credentials, session=self._session
+                )
 
                 if sf_instance:
                     self._sf_instance = sf_instance
@@ -89,6 +117,9 @@ class SalesforceClient(BaseConnector):
                     # Clear the instance
                     self._sf_instance = None
                     self._connected = False
+                    # Drop pooled connections; the session object itself
+                    # stays reusable for a later reconnect
+                    self._session.close()
                     logger.info("Disconnected from Salesforce")
 
                 return True
@@ -192,6 +223,31 @@ class SalesforceClient(BaseConnector):
                 logger.error(f"Query failed: {e}")
                 raise
 
+    def iter_query_pages(self, soql: str):
+        """
+        Execute a SOQL query and yield one result page at a time.
+
+        Follows nextRecordsUrl paging, so callers can stream arbitrarily
+        large result sets while holding at most one server page (~2000
+        records) of raw records. The first yielded page carries the
+        totalSize metadata for the whole result.
+
+        Args:
+            soql: SOQL query string
+
+        Yields:
+            Raw query result dicts, one per server page
+        """
+        result = self.query(soql)
+        yield result
+
+        while not result.get('done', True):
+            with self._lock:
+                result = self._sf_instance.query_more(
+                    result['nextRecordsUrl'], identifier_is_url=True
+                )
+            yield result
+
     def _reconnect(self) -> bool:
         """
         Attempt to reconnect to Salesforce.
@@ -205,7 +261,9 @@ class SalesforceClient(BaseConnector):
 
         try:
             logger.info("Attempting to reconnect to Salesforce")
-            sf_instance, error = SalesforceAuthenticator.authenticate(self._credentials)
+            sf_instance, error = SalesforceAuthenticator.authenticate(
+                self._credentials, session=self._session
+            )
 
             if sf_instance:
                 self._sf_instance = sf_instance
@@ -327,10 +385,10 @@ class SalesforceClient(BaseConnector):
 
         try:
             logger.info(f"Creating bulk job for {object_name} ({operation})")
-            response = requests.post(url, headers=headers, json=payload)
+            response = self._session.post(url, headers=headers, json=payload)
             response.raise_for_status()
 
-            job_data = response.json()
+            job_data = _json_loads(response.content)
             job_id = job_data['id']
             logger.info(f"Bulk job created: {job_id}")
             return job_id
@@ -375,7 +433,7 @@ class SalesforceClient(BaseConnector):
             csv_content = csv_buffer.getvalue()
 
             logger.info(f"Uploading {len(csv_data)} records to bulk job {job_id}")
-            response = requests.put(url, headers=headers, data=csv_content.encode('utf-8'))
+            response = self._session.put(url, headers=headers, data=csv_content.encode('utf-8'))
             response.raise_for_status()
 
             logger.info(f"Data uploaded successfully to job {job_id}")
@@ -410,7 +468,7 @@ class SalesforceClient(BaseConnector):
 
         try:
             logger.info(f"Closing bulk job {job_id}")
-            response = requests.patch(url, headers=headers, json=payload)
+            response = self._session.patch(url, headers=headers, json=payload)
             response.raise_for_status()
 
             logger.info(f"Bulk job {job_id} closed and processing started")
@@ -442,10 +500,10 @@ class SalesforceClient(BaseConnector):
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url, headers=headers)
             response.raise_for_status()
 
-            return response.json()
+            return _json_loads(response.content)
 
         except Exception as e:
             logger.error(f"Failed to get bulk job status: {e}")
@@ -511,14 +569,14 @@ class SalesforceClient(BaseConnector):
         try:
             # Get successful results
             success_url = f"{self._sf_instance.base_url}jobs/ingest/{job_id}/successfulResults/"
-            response = requests.get(success_url, headers=headers)
+            response = self._session.get(success_url, headers=headers)
             if response.status_code == 200:
                 csv_reader = csv.DictReader(io.StringIO(response.text))
                 results['successful'] = list(csv_reader)
 
             # Get failed results
             failed_url = f"{self._sf_instance.base_url}jobs/ingest/{job_id}/failedResults/"
-            response = requests.get(failed_url, headers=headers)
+            response = self._session.get(failed_url, headers=headers)
             if response.status_code == 200:
                 csv_reader = csv.DictReader(io.StringIO(response.text))
                 results['failed'] = list(csv_reader)
@@ -559,7 +617,7 @@ class SalesforceClient(BaseConnector):
 
         try:
             logger.info(f"Aborting bulk job {job_id}")
-            response = requests.patch(url, headers=headers, json=payload)
+            response = self._session.patch(url, headers=headers, json=payload)
             response.raise_for_status()
 
             logger.info(f"Bulk job {job_id} aborted")
@@ -616,14 +674,14 @@ class SalesforceClient(BaseConnector):
                 "Content-Type": "application/json"
             }
 
-            response = requests.get(tooling_url, headers=headers)
+            response = self._session.get(tooling_url, headers=headers)
             logger.info(f"Tooling API response status: {response.status_code}")
 
             if response.status_code != 200:
                 logger.error(f"Tooling API error: {response.text[:500]}")
                 return []
 
-            layout_result = response.json()
+            layout_result = _json_loads(response.content)
             records = layout_result.get('records', [])
 
             if not records:
@@ -641,13 +699,13 @@ class SalesforceClient(BaseConnector):
             layout_query = f"SELECT Metadata FROM Layout WHERE Id = '{layout_id}'"
             layout_url = f"{base_url}query?q={requests.utils.quote(layout_query)}"
 
-            layout_response = requests.get(layout_url, headers=headers)
+            layout_response = self._session.get(layout_url, headers=headers)
 
             if layout_response.status_code != 200:
                 logger.error(f"Failed to fetch layout metadata: {layout_response.text[:500]}")
                 return []
 
-            layout_data = layout_response.json()
+            layout_data = _json_loads(layout_response.content)
             layout_records = layout_data.get('records', [])
 
             if not layout_records:
@@ -720,7 +778,7 @@ class SalesforceClient(BaseConnector):
             }
 
             logger.info(f"Calling Metadata API listMetadata for Layout type, folder: {object_name}")
-            response = requests.post(metadata_url, headers=headers, json=payload)
+            response = self._session.post(metadata_url, headers=headers, json=payload)
 
             # If listMetadata doesn't work, try describe API
             if response.status_code != 200:
@@ -728,9 +786,9 @@ class SalesforceClient(BaseConnector):
 
                 # Alternative: use the metadata describe endpoint
                 describe_url = f"{self._sf_instance.base_url}sobjects/{object_name}/describe"
-                describe_response = requests.get(describe_url, headers=headers)
+                describe_response = self._session.get(describe_url, headers=headers)
                 describe_response.raise_for_status()
-                describe_data = describe_response.json()
+                describe_data = _json_loads(describe_response.content)
 
                 # Get record type infos which include layout information
                 record_type_infos = describe_data.get('recordTypeInfos', [])
@@ -764,10 +822,10 @@ class SalesforceClient(BaseConnector):
                         full_url = f"{base_instance_url}{layout_url}"
                         logger.info(f"Fetching layout for record type {rt_id} from: {full_url}")
 
-                        layout_response = requests.get(full_url, headers=headers)
+                        layout_response = self._session.get(full_url, headers=headers)
 
                         if layout_response.status_code == 200:
-                            layout_data = layout_response.json()
+                            layout_data = _json_loads(layout_response.content)
 
                             # Extract the layout ID from the response
                             layout_id = layout_data.get('id')
@@ -780,10 +838,10 @@ class SalesforceClient(BaseConnector):
                                     encoded_query = urllib.parse.quote(query)
                                     tooling_url = f"{base_instance_url}/services/data/v57.0/tooling/query/?q={encoded_query}"
 
-                                    tooling_response = requests.get(tooling_url, headers=headers)
+                                    tooling_response = self._session.get(tooling_url, headers=headers)
 
                                     if tooling_response.status_code == 200:
-                                        tooling_data = tooling_response.json()
+                                        tooling_data = _json_loads(tooling_response.content)
                                         records = tooling_data.get('records', [])
 
                                         if records and len(records) > 0:
@@ -823,13 +881,14 @@ class SalesforceClient(BaseConnector):
 
                 # Store layout data cache in the client for later retrieval
                 self._layout_data_cache = layout_data_cache
+                self._layout_fields_by_id.clear()  # Raw data changed
 
                 logger.info(f"Retrieved {len(layout_assignments)} layout assignments via layout URLs")
                 return layout_assignments
 
             # Process listMetadata response
             response.raise_for_status()
-            layout_list = response.json()
+            layout_list = _json_loads(response.content)
 
             if not layout_list:
                 logger.warning(f"No layouts returned from listMetadata for {object_name}")
@@ -877,6 +936,12 @@ class SalesforceClient(BaseConnector):
             List of field API names on the layout
         """
         try:
+            # Serve repeat clicks from the parsed-result memo
+            cached_fields = self._layout_fields_by_id.get(layout_id)
+            if cached_fields is not None:
+                logger.debug(f"Layout fields cache hit for {layout_id}")
+                return cached_fields
+
             if not hasattr(self, '_layout_data_cache') or not self._layout_data_cache:
                 logger.warning("No layout data cache available")
                 return []
@@ -921,7 +986,9 @@ class SalesforceClient(BaseConnector):
                                 field_names.add(field_name)
 
             logger.info(f"Extracted {len(field_names)} fields from layout {layout_id}")
-            return sorted(list(field_names))
+            result = sorted(field_names)
+            self._layout_fields_by_id[layout_id] = result
+            return result
 
         except Exception as e:
             logger.error(f"Error extracting fields from layout {layout_id}: {e}", exc_info=True)
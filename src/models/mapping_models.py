@@ -133,6 +133,52 @@ class MappingConfiguration:
         self.mappings.append(mapping)
         self.modified_date = datetime.now()
 
+    def add_mappings(self, mappings: List[FieldMapping]):
+        """
+        Add multiple field mappings in one pass.
+
+        Equivalent to calling add_mapping for each item (later mappings
+        win on duplicate target fields) but deduplicates once instead of
+        rebuilding the list per mapping.
+
+        Args:
+            mappings: FieldMapping objects to add
+        """
+        if not mappings:
+            return
+        by_target = {m.target_field: m for m in self.mappings}
+        by_target.update((m.target_field, m) for m in mappings)
+        self.mappings = list(by_target.values())
+        self.modified_date = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the configuration to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary suitable for json/orjson serialization
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "salesforce_object": self.salesforce_object,
+            "version": self.version,
+            "created_date": self.created_date.isoformat(),
+            "modified_date": self.modified_date.isoformat(),
+            "source_file_signature": self.source_file_signature,
+            "mappings": [
+                {
+                    "source_column": m.source_column,
+                    "target_field": m.target_field,
+                    "mapping_type": m.mapping_type,
+                    "transform_expr": m.transform_expr,
+                    "is_required": m.is_required
+                }
+                for m in self.mappings
+            ]
+        }
+
     def remove_mapping(self, target_field: str):
         """
         Remove a field mapping.
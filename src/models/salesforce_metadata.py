@@ -5,7 +5,7 @@ Represents Salesforce objects, fields, and relationships for schema discovery.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -18,11 +18,26 @@ class RecordType:
     label: str                          # Display label
     is_active: bool = True
     is_default: bool = False
+    display: str = field(init=False)
+
+    def __post_init__(self):
+        """Precompute the display string shown in dropdowns."""
+        default_marker = " (Default)" if self.is_default else ""
+        self.display = f"{self.label}{default_marker}"
 
     def __str__(self) -> str:
         """String representation of the record type."""
-        default_marker = " (Default)" if self.is_default else ""
-        return f"{self.label}{default_marker}"
+        return self.display
+
+
+# Bit positions for SalesforceField.flags - a single int comparison
+# answers combined capability questions that would otherwise need
+# several attribute lookups per field in counting loops
+FIELD_REQUIRED = 1 << 0
+FIELD_CREATEABLE = 1 << 1
+FIELD_UPDATEABLE = 1 << 2
+FIELD_CALCULATED = 1 << 3
+FIELD_AUTO_NUMBER = 1 << 4
 
 
 @dataclass
@@ -42,6 +57,20 @@ class SalesforceField:
     default_value: Optional[str] = None
     calculated: bool = False            # Formula field
     auto_number: bool = False          # Auto-number field
+    warn_non_updateable: bool = field(init=False)
+    flags: int = field(init=False)      # Bitmask of FIELD_* constants
+
+    def __post_init__(self):
+        """Precompute validation flags."""
+        # Id is read-only by design, so it never warrants a warning
+        self.warn_non_updateable = not self.updateable and self.name != 'Id'
+        self.flags = (
+            (FIELD_REQUIRED if self.required else 0)
+            | (FIELD_CREATEABLE if self.createable else 0)
+            | (FIELD_UPDATEABLE if self.updateable else 0)
+            | (FIELD_CALCULATED if self.calculated else 0)
+            | (FIELD_AUTO_NUMBER if self.auto_number else 0)
+        )
 
     def __str__(self) -> str:
         """String representation of the field."""
@@ -64,15 +93,62 @@ class SalesforceObject:
     queryable: bool = True
     record_count: Optional[int] = None  # Cached from COUNT() query
     fetched_at: Optional[datetime] = None  # Metadata cache timestamp
+    _fields_by_name: Optional[Dict[str, SalesforceField]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _required_fields: Optional[List[SalesforceField]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _has_non_updateable: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _record_types_sorted: Optional[List[RecordType]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         """String representation of the object."""
         object_type = "Custom" if self.custom else "Standard"
         return f"{self.label} ({self.name}) - {object_type}"
 
+    def get_field_index(self) -> Dict[str, SalesforceField]:
+        """Get a name → field lookup dict (built lazily and cached)."""
+        if self._fields_by_name is None:
+            self._fields_by_name = {f.name: f for f in self.fields}
+        return self._fields_by_name
+
+    def invalidate_field_cache(self) -> None:
+        """Clear cached field lookups (call after refreshing fields)."""
+        self._fields_by_name = None
+        self._required_fields = None
+        self._has_non_updateable = None
+        self._record_types_sorted = None
+
+    def has_non_updateable_fields(self) -> bool:
+        """Check whether any non-system field is read-only (cached)."""
+        if self._has_non_updateable is None:
+            self._has_non_updateable = any(
+                f.warn_non_updateable for f in self.fields
+            )
+        return self._has_non_updateable
+
+    def get_record_types_sorted(self) -> List[RecordType]:
+        """Get record types sorted default-first then by name (cached).
+
+        Widgets and presenter callbacks that address record types by row
+        index share this ordering, so it is computed once per object.
+        """
+        if self._record_types_sorted is None:
+            self._record_types_sorted = sorted(
+                self.record_types, key=lambda rt: (not rt.is_default, rt.name)
+            )
+        return self._record_types_sorted
+
     def get_required_fields(self) -> List[SalesforceField]:
-        """Get list of required fields."""
-        return [f for f in self.fields if f.required]
+        """Get list of required fields (cached after first call)."""
+        if self._required_fields is None:
+            self._required_fields = [f for f in self.fields if f.required]
+        return self._required_fields
 
     def get_updateable_fields(self) -> List[SalesforceField]:
         """Get list of updateable fields."""
@@ -5,6 +5,7 @@ Orchestrates the authentication workflow, coordinating between
 credential storage, validation, and Salesforce connection.
 """
 
+import threading
 from typing import Optional, Tuple
 from datetime import datetime
 
@@ -35,7 +36,8 @@ class AuthService:
                     password: str,
                     security_token: str,
                     instance_url: str = "https://login.salesforce.com",
-                    remember_credentials: bool = False) -> ConnectionStatus:
+                    remember_credentials: bool = False,
+                    cancel_event: Optional[threading.Event] = None) -> ConnectionStatus:
         """
         Authenticate with Salesforce.
 
@@ -45,12 +47,17 @@ class AuthService:
             security_token: Salesforce security token
             instance_url: Salesforce instance URL
             remember_credentials: Whether to save credentials to keyring
+            cancel_event: Optional event checked between phases so callers
+                can cancel cooperatively (e.g. on app shutdown)
 
         Returns:
             ConnectionStatus object with authentication result
         """
         logger.info(f"Authentication request for user: {username}")
 
+        if cancel_event is not None and cancel_event.is_set():
+            return self._cancelled_status()
+
         # Validate credentials
         valid, error_msg = validate_credentials(username, password, security_token)
         if not valid:
@@ -73,6 +80,10 @@ class AuthService:
         try:
             self.sf_client.connect(credentials)
 
+            if cancel_event is not None and cancel_event.is_set():
+                self.sf_client.disconnect()
+                return self._cancelled_status()
+
             # Get metadata
             metadata = self.sf_client.get_metadata()
 
@@ -126,6 +137,16 @@ class AuthService:
             # Clear sensitive data from memory
             CredentialManager.clear_sensitive_data(credentials)
 
+    @staticmethod
+    def _cancelled_status() -> ConnectionStatus:
+        """Build the ConnectionStatus returned for a cancelled attempt."""
+        logger.info("Authentication cancelled")
+        return ConnectionStatus(
+            success=False,
+            message="Authentication cancelled",
+            error="Cancelled"
+        )
+
     def load_saved_credentials(self, username: str) -> Optional[SalesforceCredentials]:
         """
         Load saved credentials from keyring.
@@ -5,6 +5,8 @@ Transforms CSV data based on field mappings and inserts/updates records.
 """
 
 import csv
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,6 +23,13 @@ logger = get_logger(__name__)
 # Threshold for switching from REST API to Bulk API
 BULK_API_THRESHOLD = 200
 
+# Records per bulk job when splitting large loads into parallel jobs
+BULK_CHUNK_SIZE = 10000
+
+# Concurrent bulk jobs - kept well under Salesforce's concurrent
+# ingest-job limits so other org integrations are not starved
+BULK_MAX_PARALLEL_JOBS = 4
+
 
 @dataclass
 class LoadResult:
@@ -58,7 +67,8 @@ class DataLoaderService:
         salesforce_object: SalesforceObject,
         operation: str = 'insert',
         record_type_id: Optional[str] = None,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> LoadResult:
         """
         Load data from source file to Salesforce.
@@ -70,6 +80,8 @@ class DataLoaderService:
             operation: 'insert' or 'update'
             record_type_id: Optional record type ID to assign to new records
             progress_callback: Optional callback for progress updates (message: str)
+            cancel_event: Optional event checked between records; a set
+                event stops the load cleanly with a partial result
 
         Returns:
             LoadResult with statistics and errors
@@ -93,9 +105,9 @@ class DataLoaderService:
             logger.info(f"Using REST API for {total_rows} records")
             # Load to Salesforce using REST API
             if operation == 'insert':
-                result = self._insert_records(salesforce_object.name, transformed_data, progress_callback)
+                result = self._insert_records(salesforce_object.name, transformed_data, progress_callback, cancel_event)
             elif operation == 'update':
-                result = self._update_records(salesforce_object.name, transformed_data, progress_callback)
+                result = self._update_records(salesforce_object.name, transformed_data, progress_callback, cancel_event)
             else:
                 raise ValueError(f"Invalid operation: {operation}")
 
@@ -337,6 +349,11 @@ class DataLoaderService:
         """
         Load records using Bulk API 2.0.
 
+        Loads above BULK_CHUNK_SIZE are split into chunks submitted as
+        separate bulk jobs running in parallel (a Bulk 2.0 job accepts a
+        single data upload, so parallelism means multiple jobs). Smaller
+        loads keep the single-job path.
+
         Args:
             object_name: Salesforce object API name
             records: Records to load
@@ -344,10 +361,82 @@ class DataLoaderService:
             progress_callback: Optional callback for progress updates
 
         Returns:
-            LoadResult
+            LoadResult (aggregated across chunks for large loads)
         """
         logger.info(f"Starting Bulk API load: {len(records)} records to {object_name}")
 
+        if len(records) <= BULK_CHUNK_SIZE:
+            return self._run_bulk_job(object_name, records, operation, 0, progress_callback)
+
+        chunks = [
+            records[start:start + BULK_CHUNK_SIZE]
+            for start in range(0, len(records), BULK_CHUNK_SIZE)
+        ]
+        logger.info(
+            f"Splitting load into {len(chunks)} bulk jobs of up to {BULK_CHUNK_SIZE} records"
+        )
+
+        completed = 0
+        completed_lock = threading.Lock()
+
+        def run_chunk(chunk_idx: int) -> LoadResult:
+            nonlocal completed
+            chunk_result = self._run_bulk_job(
+                object_name,
+                chunks[chunk_idx],
+                operation,
+                chunk_idx * BULK_CHUNK_SIZE,
+                # Per-job status messages would interleave across
+                # threads; the aggregate message below replaces them
+                progress_callback=None
+            )
+            if progress_callback:
+                with completed_lock:
+                    completed += 1
+                    done = completed
+                progress_callback(f"Completed bulk job {done} of {len(chunks)}...")
+            return chunk_result
+
+        if progress_callback:
+            progress_callback(f"Submitting {len(chunks)} parallel bulk jobs...")
+
+        max_workers = min(BULK_MAX_PARALLEL_JOBS, len(chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = list(executor.map(run_chunk, range(len(chunks))))
+
+        errors = []
+        for chunk_result in chunk_results:
+            errors.extend(chunk_result.errors)
+
+        return LoadResult(
+            total_rows=len(records),
+            successful_rows=sum(r.successful_rows for r in chunk_results),
+            failed_rows=sum(r.failed_rows for r in chunk_results),
+            errors=errors
+        )
+
+    def _run_bulk_job(
+        self,
+        object_name: str,
+        records: List[Dict[str, Any]],
+        operation: str,
+        row_offset: int = 0,
+        progress_callback: Optional[callable] = None
+    ) -> LoadResult:
+        """
+        Run one Bulk API 2.0 job end to end.
+
+        Args:
+            object_name: Salesforce object API name
+            records: Records for this job
+            operation: 'insert', 'update', 'upsert', or 'delete'
+            row_offset: Source-file row offset for error reporting when
+                this job covers a chunk of a larger load
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            LoadResult for this job's records
+        """
         try:
             # Step 1: Create bulk job
             if progress_callback:
@@ -392,7 +481,7 @@ class DataLoaderService:
             errors = []
             for idx, failed_record in enumerate(results['failed']):
                 errors.append({
-                    'row': idx + 1,
+                    'row': row_offset + idx + 1,
                     'record': failed_record,
                     'error': failed_record.get('sf__Error', 'Unknown error')
                 })
@@ -416,7 +505,7 @@ class DataLoaderService:
                 successful_rows=0,
                 failed_rows=len(records),
                 errors=[{
-                    'row': 0,
+                    'row': row_offset,
                     'record': {},
                     'error': f"Bulk API error: {str(e)}"
                 }]
@@ -426,7 +515,8 @@ class DataLoaderService:
         self,
         object_name: str,
         records: List[Dict[str, Any]],
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> LoadResult:
         """
         Insert records into Salesforce.
@@ -435,6 +525,7 @@ class DataLoaderService:
             object_name: Salesforce object API name
             records: Records to insert
             progress_callback: Optional callback for progress updates
+            cancel_event: Optional event checked between records
 
         Returns:
             LoadResult
@@ -451,6 +542,9 @@ class DataLoaderService:
 
         # Insert records one by one (for now - can optimize with bulk later)
         for idx, record in enumerate(records):
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Insert cancelled after {idx} of {total_records} records")
+                break
             try:
                 # Remove None values and Id field for insert
                 cleaned_record = {k: v for k, v in record.items() if v is not None and k != 'Id'}
@@ -500,7 +594,8 @@ class DataLoaderService:
         self,
         object_name: str,
         records: List[Dict[str, Any]],
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        cancel_event: Optional[threading.Event] = None
     ) -> LoadResult:
         """
         Update records in Salesforce.
@@ -509,6 +604,7 @@ class DataLoaderService:
             object_name: Salesforce object API name
             records: Records to update (must include Id field)
             progress_callback: Optional callback for progress updates
+            cancel_event: Optional event checked between records
 
         Returns:
             LoadResult
@@ -525,6 +621,9 @@ class DataLoaderService:
 
         # Update records one by one
         for idx, record in enumerate(records):
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Update cancelled after {idx} of {total_records} records")
+                break
             try:
                 # Must have Id field for update
                 if 'Id' not in record or not record['Id']:
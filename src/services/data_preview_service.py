@@ -4,7 +4,8 @@ Data preview service - executes SOQL queries to fetch sample data.
 Retrieves a limited number of records for preview purposes.
 """
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 
 from ..core.logging_config import get_logger
@@ -13,6 +14,9 @@ from ..models.salesforce_metadata import SalesforceObject
 
 logger = get_logger(__name__)
 
+# Rows per incremental batch handed to a chunk_callback during cleaning
+_PREVIEW_CHUNK_SIZE = 500
+
 
 class DataPreviewService:
     """
@@ -33,7 +37,8 @@ class DataPreviewService:
         object_name: str,
         fields: List[str],
         limit: int = 20,
-        record_type_id: Optional[str] = None
+        record_type_id: Optional[str] = None,
+        chunk_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None
     ) -> Dict[str, Any]:
         """
         Fetch sample records from an object.
@@ -43,6 +48,9 @@ class DataPreviewService:
             fields: List of field API names to retrieve
             limit: Maximum number of records to fetch (default 20)
             record_type_id: Optional record type ID to filter by
+            chunk_callback: Optional callable invoked with each batch of
+                cleaned records as they are processed, so callers can
+                render incrementally instead of waiting for the full set
 
         Returns:
             Dictionary with 'records' list and 'total_size' count
@@ -50,9 +58,9 @@ class DataPreviewService:
         logger.info(f"Fetching sample data for {object_name} (limit: {limit}, record_type: {record_type_id or 'all'})")
 
         try:
-            # Build SOQL query
-            field_list = ", ".join(fields)
-            soql = f"SELECT {field_list} FROM {object_name}"
+            # Build SOQL query (prefix is cached per object/field-set, since the
+            # preview workflow repeats the same field list across calls)
+            soql = self._build_soql_prefix(object_name, tuple(fields))
 
             # Add WHERE clause for record type if specified
             if record_type_id:
@@ -62,17 +70,24 @@ class DataPreviewService:
 
             logger.debug(f"Executing SOQL: {soql}")
 
-            # Execute query
-            result = self.sf_client.query(soql)
-
-            records = result.get('records', [])
-            total_size = result.get('totalSize', 0)
-
-            # Remove 'attributes' from each record (internal Salesforce metadata)
+            # Page through results so at most one server page of raw
+            # records is held at a time; 'attributes' (internal
+            # Salesforce metadata) is stripped as each page lands and
+            # batches are handed to the chunk callback as they are ready
             cleaned_records = []
-            for record in records:
-                cleaned = {k: v for k, v in record.items() if k != 'attributes'}
-                cleaned_records.append(cleaned)
+            batch_start = 0
+            total_size = 0
+            for page_idx, page in enumerate(self.sf_client.iter_query_pages(soql)):
+                if page_idx == 0:
+                    total_size = page.get('totalSize', 0)
+                for record in page.get('records', []):
+                    cleaned = {k: v for k, v in record.items() if k != 'attributes'}
+                    cleaned_records.append(cleaned)
+                    if chunk_callback and len(cleaned_records) - batch_start >= _PREVIEW_CHUNK_SIZE:
+                        chunk_callback(cleaned_records[batch_start:])
+                        batch_start = len(cleaned_records)
+            if chunk_callback and batch_start < len(cleaned_records):
+                chunk_callback(cleaned_records[batch_start:])
 
             logger.info(f"Retrieved {len(cleaned_records)} records for {object_name}")
 
@@ -85,13 +100,29 @@ class DataPreviewService:
             logger.error(f"Error fetching sample data for {object_name}: {e}")
             raise
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_soql_prefix(object_name: str, fields_tuple: tuple) -> str:
+        """
+        Build (and cache) the SELECT ... FROM prefix of a preview query.
+
+        Args:
+            object_name: API name of the object
+            fields_tuple: Tuple of field API names (hashable for caching)
+
+        Returns:
+            SOQL string without WHERE/LIMIT clauses
+        """
+        return f"SELECT {', '.join(fields_tuple)} FROM {object_name}"
+
     def get_sample_data_for_object(
         self,
         salesforce_object: SalesforceObject,
         limit: int = 20,
         include_all_required: bool = True,
         record_type_id: Optional[str] = None,
-        layout_fields: Optional[List[str]] = None
+        layout_fields: Optional[List[str]] = None,
+        chunk_callback: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Fetch sample records for a SalesforceObject.
@@ -104,6 +135,9 @@ class DataPreviewService:
             include_all_required: Whether to include all required fields (default True)
             record_type_id: Optional record type ID to filter by
             layout_fields: Optional list of fields from page layout (if provided, overrides automatic selection)
+            chunk_callback: Optional callable invoked with
+                {'records': batch, 'fields': selected_fields} per batch
+                for incremental rendering
 
         Returns:
             Dictionary with 'records', 'total_size', and 'fields' (field names used)
@@ -132,11 +166,17 @@ class DataPreviewService:
             }
 
         # Fetch data
+        row_callback = None
+        if chunk_callback:
+            row_callback = lambda batch: chunk_callback(
+                {'records': batch, 'fields': selected_fields}
+            )
         result = self.get_sample_data(
             salesforce_object.name,
             selected_fields,
             limit,
-            record_type_id
+            record_type_id,
+            chunk_callback=row_callback
         )
 
         result['fields'] = selected_fields
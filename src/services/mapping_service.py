@@ -5,11 +5,28 @@ Handles creation, validation, and persistence of field mappings.
 """
 
 import json
+from functools import lru_cache
+
+# orjson serializes straight to bytes several times faster than the
+# stdlib encoder; optional - falls back to json below
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from difflib import SequenceMatcher
 
+# rapidfuzz scores every (source, target) pair in C across all cores;
+# optional - the difflib path below covers installs without it
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz import process as _rf_process
+except ImportError:
+    _rf_fuzz = None
+    _rf_process = None
+
 from ..core.logging_config import get_logger
 from ..models.mapping_models import (
     SourceFile, FieldMapping, MappingConfiguration
@@ -85,45 +102,139 @@ class MappingService:
 
         suggestions = []
 
+        # Normalize every target name/label once per call instead of once
+        # per (source, target) pair; the O(N*M) comparison loop then works
+        # on precomputed profiles
+        field_profiles = [
+            (sf_field, self._normalize(sf_field.name), self._normalize(sf_field.label))
+            for sf_field in salesforce_object.fields
+        ]
+
+        # Most real mappings are exact matches after normalization
+        # (Email == Email, account_id == AccountId), so resolve those
+        # with a dict lookup and only run fuzzy scoring on the rest.
+        # Field API names win over labels on key collisions; empty keys
+        # are skipped (names like 'Id' normalize to '')
+        target_index: Dict[str, SalesforceField] = {}
+        for sf_field, name_norm, label_norm in field_profiles:
+            if name_norm and name_norm not in target_index:
+                target_index[name_norm] = sf_field
+            if label_norm and label_norm not in target_index:
+                target_index[label_norm] = sf_field
+
+        matches = []
+        fuzzy_columns = []
         for source_col in source_file.columns:
-            best_match = None
-            best_score = threshold
+            source_norm = self._normalize(source_col.name)
+            exact = target_index.get(source_norm) if source_norm else None
+            if exact is not None:
+                matches.append((source_col, exact, 1.0))
+            else:
+                fuzzy_columns.append(source_col)
+
+        if fuzzy_columns:
+            if _rf_process is not None:
+                matches.extend(self._score_columns_rapidfuzz(
+                    fuzzy_columns, field_profiles, threshold
+                ))
+            else:
+                matches.extend(self._score_columns_difflib(
+                    fuzzy_columns, field_profiles, threshold
+                ))
+            # Keep suggestions in source-column order regardless of
+            # which pass matched them
+            matches.sort(key=lambda m: m[0].index)
+
+        for source_col, best_match, best_score in matches:
+            mapping = FieldMapping(
+                source_column=source_col.name,
+                target_field=best_match.name,
+                mapping_type='direct',
+                is_required=best_match.required
+            )
+            suggestions.append(mapping)
+            logger.debug(
+                f"Suggested mapping: {source_col.name} → {best_match.name} "
+                f"(score: {best_score:.2f})"
+            )
 
-            # Compare with each Salesforce field
-            for sf_field in salesforce_object.fields:
-                # Calculate similarity scores
-                name_score = self._calculate_similarity(
-                    source_col.name,
-                    sf_field.name
-                )
-                label_score = self._calculate_similarity(
-                    source_col.name,
-                    sf_field.label
+        logger.info(f"Generated {len(suggestions)} mapping suggestions")
+        return suggestions
+
+    def _score_columns_rapidfuzz(self, columns, field_profiles, threshold):
+        """
+        Score all (source, target) pairs in one rapidfuzz cdist call.
+
+        cdist builds the full similarity matrix in C with all cores
+        (workers=-1), so the Python side is reduced to one argmax per
+        source column.
+
+        Returns:
+            List of (source_col, best_field, best_score) tuples
+        """
+        sources = [self._normalize(col.name) for col in columns]
+        # Name and label normalizations interleave; candidate i belongs
+        # to field_profiles[i // 2]
+        candidates = [
+            norm
+            for _, name_norm, label_norm in field_profiles
+            for norm in (name_norm, label_norm)
+        ]
+        scores = _rf_process.cdist(
+            sources, candidates,
+            scorer=_rf_fuzz.ratio,
+            score_cutoff=threshold * 100,
+            workers=-1
+        )
+
+        matches = []
+        for row, source_col in enumerate(columns):
+            best_idx = int(scores[row].argmax())
+            best_score = scores[row][best_idx] / 100.0
+            if best_score > threshold:
+                matches.append(
+                    (source_col, field_profiles[best_idx // 2][0], best_score)
                 )
+        return matches
+
+    def _score_columns_difflib(self, columns, field_profiles, threshold):
+        """
+        Pure-Python fallback scorer when rapidfuzz is not installed.
+
+        Returns:
+            List of (source_col, best_field, best_score) tuples
+        """
+        matcher = SequenceMatcher()
+        matches = []
 
-                # Use the better score
-                score = max(name_score, label_score)
+        for source_col in columns:
+            best_match = None
+            best_score = threshold
+
+            # SequenceMatcher indexes seq2 once; keeping the source column
+            # there reuses that index across every target comparison
+            matcher.set_seq2(self._normalize(source_col.name))
+
+            for sf_field, name_norm, label_norm in field_profiles:
+                score = 0.0
+                for candidate in (name_norm, label_norm):
+                    matcher.set_seq1(candidate)
+                    # Cheap upper bound first - skip the full ratio when
+                    # it cannot beat the current best
+                    if matcher.real_quick_ratio() <= best_score:
+                        continue
+                    if matcher.quick_ratio() <= best_score:
+                        continue
+                    score = max(score, matcher.ratio())
 
                 if score > best_score:
                     best_score = score
                     best_match = sf_field
 
-            # If we found a good match, create mapping
             if best_match:
-                mapping = FieldMapping(
-                    source_column=source_col.name,
-                    target_field=best_match.name,
-                    mapping_type='direct',
-                    is_required=best_match.required
-                )
-                suggestions.append(mapping)
-                logger.debug(
-                    f"Suggested mapping: {source_col.name} → {best_match.name} "
-                    f"(score: {best_score:.2f})"
-                )
+                matches.append((source_col, best_match, best_score))
 
-        logger.info(f"Generated {len(suggestions)} mapping suggestions")
-        return suggestions
+        return matches
 
     def save_mapping(self, config: MappingConfiguration, file_path: str):
         """
@@ -135,34 +246,17 @@ class MappingService:
         """
         logger.info(f"Saving mapping to: {file_path}")
 
-        # Convert to dictionary
-        data = {
-            "id": config.id,
-            "name": config.name,
-            "description": config.description,
-            "salesforce_object": config.salesforce_object,
-            "version": config.version,
-            "created_date": config.created_date.isoformat(),
-            "modified_date": config.modified_date.isoformat(),
-            "source_file_signature": config.source_file_signature,
-            "mappings": [
-                {
-                    "source_column": m.source_column,
-                    "target_field": m.target_field,
-                    "mapping_type": m.mapping_type,
-                    "transform_expr": m.transform_expr,
-                    "is_required": m.is_required
-                }
-                for m in config.mappings
-            ]
-        }
+        data = config.to_dict()
 
-        # Write to file
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
 
         logger.info(f"Saved mapping with {len(config.mappings)} field mappings")
 
@@ -209,6 +303,31 @@ class MappingService:
         logger.info(f"Loaded mapping with {len(config.mappings)} field mappings")
         return config
 
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _normalize(name: str) -> str:
+        """
+        Normalize a column/field name for similarity comparison.
+
+        Lowercases, strips underscores and spaces, and drops common
+        suffixes. Cached because the same field names recur across
+        auto-map runs and objects.
+
+        Args:
+            name: Raw column or field name
+
+        Returns:
+            Normalized comparison key
+        """
+        s = name.lower().replace('_', '').replace(' ', '')
+
+        # Remove common suffixes
+        for suffix in ['__c', 'id', 'name']:
+            if s.endswith(suffix):
+                s = s[:-len(suffix)]
+
+        return s
+
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
         Calculate similarity between two strings.
@@ -225,16 +344,6 @@ class MappingService:
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        # Normalize strings
-        s1 = str1.lower().replace('_', '').replace(' ', '')
-        s2 = str2.lower().replace('_', '').replace(' ', '')
-
-        # Remove common suffixes
-        for suffix in ['__c', 'id', 'name']:
-            if s1.endswith(suffix):
-                s1 = s1[:-len(suffix)]
-            if s2.endswith(suffix):
-                s2 = s2[:-len(suffix)]
-
-        # Calculate similarity
-        return SequenceMatcher(None, s1, s2).ratio()
+        return SequenceMatcher(
+            None, self._normalize(str1), self._normalize(str2)
+        ).ratio()
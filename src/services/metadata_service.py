@@ -43,6 +43,10 @@ class MetadataService:
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Session-scoped describe cache: re-selecting an object reuses the
+        # parsed metadata instead of re-hitting the describe endpoint
+        self._describe_cache: Dict[str, SalesforceObject] = {}
+
         logger.info(f"MetadataService initialized with cache dir: {self.cache_dir}")
 
     def get_all_objects(self,
@@ -133,6 +137,35 @@ class MetadataService:
             logger.error(f"Failed to get metadata for {object_name}: {e}")
             raise
 
+    def get_object_metadata_cached(self, object_name: str) -> SalesforceObject:
+        """
+        Get object metadata, serving repeats from the session cache.
+
+        Describe calls are expensive (20-130ms server side plus HTTP), so
+        re-selecting a previously-viewed object should not re-hit the
+        network. The cache lives for the session; call flush_cache() on
+        logout to drop it.
+
+        Args:
+            object_name: API name of the Salesforce object
+
+        Returns:
+            SalesforceObject with full field metadata
+        """
+        cached = self._describe_cache.get(object_name)
+        if cached is not None:
+            logger.debug(f"Describe cache hit for {object_name}")
+            return cached
+
+        obj = self.get_object_metadata(object_name)
+        self._describe_cache[object_name] = obj
+        return obj
+
+    def flush_cache(self):
+        """Clear the session describe cache (e.g. on logout)."""
+        logger.debug(f"Flushing describe cache ({len(self._describe_cache)} entries)")
+        self._describe_cache.clear()
+
     def _parse_object_describe(self, describe_data: Dict[str, Any]) -> SalesforceObject:
         """
         Parse Salesforce describe response into SalesforceObject model.
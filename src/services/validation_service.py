@@ -4,8 +4,12 @@ Validation service - validates field mappings.
 Checks mapping completeness, type compatibility, and data constraints.
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 
 from ..core.logging_config import get_logger
 from ..models.mapping_models import MappingConfiguration, FieldMapping
@@ -13,34 +17,113 @@ from ..models.salesforce_metadata import SalesforceObject, SalesforceField
 
 logger = get_logger(__name__)
 
+# Precompiled message templates - formatting is deferred until a message
+# is actually displayed, so the happy path skips string construction
+_MSG_MISSING_REQUIRED = "Required field '{0}' ({1}) is not mapped"
+_MSG_DUPLICATE_MAPPING = "Multiple source columns mapped to '{0}' ({1})"
+_MSG_INVALID_FIELD = "Target field '{0}' does not exist on {1}"
+_MSG_NON_UPDATEABLE = "Field '{0}' ({1}) is not updateable"
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationError:
-    """Represents a validation error."""
+    """Represents a validation error.
+
+    The message is rendered lazily from a template on first access,
+    so errors that are never shown cost no string formatting.
+    """
     field_name: str
     error_type: str  # 'missing_required', 'type_mismatch', 'invalid_field'
-    message: str
     severity: str = 'error'  # 'error' or 'warning'
+    template: str = ''
+    args: Tuple = ()
+    _message: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def message(self) -> str:
+        """Human-readable message (formatted on demand and cached)."""
+        if self._message is None:
+            self._message = self.template.format(*self.args)
+        return self._message
+
 
+# Raw issue tuple produced by the scanner:
+# (field_name, error_type, severity, template, args)
+_RawIssue = Tuple[str, str, str, str, Tuple]
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of mapping validation."""
+    """Result of mapping validation.
+
+    The scanner records lightweight raw tuples; ValidationError objects
+    are only materialized when a caller actually reads errors/warnings,
+    so checking is_valid on a clean result allocates nothing extra.
+    """
     is_valid: bool
-    errors: List[ValidationError]
-    warnings: List[ValidationError]
+    raw_errors: List[_RawIssue] = field(default_factory=list)
+    raw_warnings: List[_RawIssue] = field(default_factory=list)
+    _errors: Optional[List[ValidationError]] = field(default=None, repr=False, compare=False)
+    _warnings: Optional[List[ValidationError]] = field(default=None, repr=False, compare=False)
+    _all_issues: Optional[List[ValidationError]] = field(default=None, repr=False, compare=False)
+
+    @staticmethod
+    def _materialize(raw_issues: List[_RawIssue]) -> List[ValidationError]:
+        """Convert raw issue tuples into ValidationError objects."""
+        return [
+            ValidationError(
+                field_name=field_name,
+                error_type=error_type,
+                severity=severity,
+                template=template,
+                args=args
+            )
+            for field_name, error_type, severity, template, args in raw_issues
+        ]
+
+    @property
+    def errors(self) -> List[ValidationError]:
+        """Errors as ValidationError objects (materialized on demand)."""
+        if self._errors is None:
+            self._errors = self._materialize(self.raw_errors)
+        return self._errors
+
+    @property
+    def warnings(self) -> List[ValidationError]:
+        """Warnings as ValidationError objects (materialized on demand)."""
+        if self._warnings is None:
+            self._warnings = self._materialize(self.raw_warnings)
+        return self._warnings
 
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return len(self.raw_errors) > 0
 
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return len(self.warnings) > 0
+        return len(self.raw_warnings) > 0
+
+    @property
+    def total_issues(self) -> int:
+        """Total number of errors and warnings (no materialization)."""
+        return len(self.raw_errors) + len(self.raw_warnings)
 
     def get_all_issues(self) -> List[ValidationError]:
-        """Get all errors and warnings combined."""
-        return self.errors + self.warnings
+        """Get all errors and warnings combined (cached after first call)."""
+        if self._all_issues is None:
+            self._all_issues = self.errors + self.warnings
+        return self._all_issues
+
+
+# Batches at or below this size are validated serially; process spawn
+# overhead only pays off for larger project-wide validations
+_PARALLEL_VALIDATION_THRESHOLD = 4
+
+
+def _validate_one(pair: Tuple[List[FieldMapping], SalesforceObject]) -> 'ValidationResult':
+    """Validate one (mappings, object) pair (top-level for pickling)."""
+    mappings, salesforce_object = pair
+    return MappingValidationService().validate(mappings, salesforce_object)
 
 
 class MappingValidationService:
@@ -67,62 +150,78 @@ class MappingValidationService:
         Returns:
             ValidationResult with errors and warnings
         """
-        logger.info(f"Validating {len(mappings)} mappings for {salesforce_object.name}")
+        logger.info("Validating %d mappings for %s", len(mappings), salesforce_object.name)
 
         errors = []
         warnings = []
 
-        # Build lookup for Salesforce fields
-        sf_fields_by_name = {f.name: f for f in salesforce_object.fields}
+        # Field lookup and required-field list are cached on the object, so
+        # repeat validations against the same object skip the rebuild
+        sf_fields_by_name = salesforce_object.get_field_index()
+        required_fields = salesforce_object.get_required_fields()
+
+        # Fast path: nothing mapped yet, so only missing-required errors apply
+        if not mappings:
+            for required_field in required_fields:
+                errors.append((
+                    required_field.name, 'missing_required', 'error',
+                    _MSG_MISSING_REQUIRED, (required_field.label, required_field.name)
+                ))
+            result = ValidationResult(
+                is_valid=not errors,
+                raw_errors=errors,
+                raw_warnings=warnings
+            )
+            logger.info(
+                "Validation result: %s (%d errors, 0 warnings)",
+                'VALID' if result.is_valid else 'INVALID', len(errors)
+            )
+            return result
 
-        # Check for required fields
-        required_fields = [f for f in salesforce_object.fields if f.required]
-        mapped_fields = {m.target_field for m in mappings}
+        # Skip the read-only scan entirely when every field is updateable
+        # (common for custom objects); the flag is cached on the object
+        check_updateable = salesforce_object.has_non_updateable_fields()
 
-        for required_field in required_fields:
-            if required_field.name not in mapped_fields:
-                errors.append(ValidationError(
-                    field_name=required_field.name,
-                    error_type='missing_required',
-                    message=f"Required field '{required_field.label}' ({required_field.name}) is not mapped",
-                    severity='error'
-                ))
+        # Tally target fields in one C-level pass (map + attrgetter keeps the
+        # whole scan out of the bytecode interpreter even for huge mapping
+        # sets); the keys double as the mapped-field set, so per-target
+        # checks run once per distinct target
+        target_field_counts = Counter(map(attrgetter('target_field'), mappings))
 
-        # Check for duplicate mappings (multiple source columns → same target field)
-        target_field_counts: Dict[str, int] = {}
-        for mapping in mappings:
-            target_field_counts[mapping.target_field] = target_field_counts.get(mapping.target_field, 0) + 1
+        # Bind hot-loop methods to locals: LOAD_FAST beats repeated
+        # attribute lookups in the CPython interpreter
+        _sf_get = sf_fields_by_name.get
+        _err_append = errors.append
+        _warn_append = warnings.append
 
         for target_field, count in target_field_counts.items():
-            if count > 1:
-                sf_field = sf_fields_by_name.get(target_field)
-                field_label = sf_field.label if sf_field else target_field
-                warnings.append(ValidationError(
-                    field_name=target_field,
-                    error_type='duplicate_mapping',
-                    message=f"Multiple source columns mapped to '{field_label}' ({target_field})",
-                    severity='warning'
+            # Single dict lookup drives all per-target branches below
+            sf_field = _sf_get(target_field)
+            if sf_field is None:
+                _err_append((
+                    target_field, 'invalid_field', 'error',
+                    _MSG_INVALID_FIELD, (target_field, salesforce_object.name)
+                ))
+            elif check_updateable and sf_field.warn_non_updateable:
+                _warn_append((
+                    target_field, 'non_updateable', 'warning',
+                    _MSG_NON_UPDATEABLE, (sf_field.label, sf_field.name)
                 ))
 
-        # Check for invalid target fields
-        for mapping in mappings:
-            if mapping.target_field not in sf_fields_by_name:
-                errors.append(ValidationError(
-                    field_name=mapping.target_field,
-                    error_type='invalid_field',
-                    message=f"Target field '{mapping.target_field}' does not exist on {salesforce_object.name}",
-                    severity='error'
+            # Duplicate mappings (multiple source columns → same target field)
+            if count > 1:
+                field_label = sf_field.label if sf_field else target_field
+                _warn_append((
+                    target_field, 'duplicate_mapping', 'warning',
+                    _MSG_DUPLICATE_MAPPING, (field_label, target_field)
                 ))
 
-        # Check for non-updateable fields
-        for mapping in mappings:
-            sf_field = sf_fields_by_name.get(mapping.target_field)
-            if sf_field and not sf_field.updateable and sf_field.name != 'Id':
-                warnings.append(ValidationError(
-                    field_name=mapping.target_field,
-                    error_type='non_updateable',
-                    message=f"Field '{sf_field.label}' ({sf_field.name}) is not updateable",
-                    severity='warning'
+        # Check for required fields (target_field_counts doubles as the mapped set)
+        for required_field in required_fields:
+            if required_field.name not in target_field_counts:
+                errors.append((
+                    required_field.name, 'missing_required', 'error',
+                    _MSG_MISSING_REQUIRED, (required_field.label, required_field.name)
                 ))
 
         # Determine overall validity
@@ -130,17 +229,41 @@ class MappingValidationService:
 
         result = ValidationResult(
             is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
+            raw_errors=errors,
+            raw_warnings=warnings
         )
 
         logger.info(
-            f"Validation result: {'VALID' if is_valid else 'INVALID'} "
-            f"({len(errors)} errors, {len(warnings)} warnings)"
+            "Validation result: %s (%d errors, %d warnings)",
+            'VALID' if is_valid else 'INVALID', len(errors), len(warnings)
         )
 
         return result
 
+    def validate_many(
+        self,
+        pairs: List[Tuple[List[FieldMapping], SalesforceObject]]
+    ) -> List[ValidationResult]:
+        """
+        Validate multiple mapping configurations.
+
+        Small batches run serially; larger batches are spread across CPU
+        cores with a process pool (validation is pure-Python/CPU-bound,
+        so threads would not help under the GIL).
+
+        Args:
+            pairs: List of (mappings, salesforce_object) tuples
+
+        Returns:
+            List of ValidationResult in the same order as pairs
+        """
+        if len(pairs) <= _PARALLEL_VALIDATION_THRESHOLD:
+            return [self.validate(mappings, sf_object) for mappings, sf_object in pairs]
+
+        logger.info("Validating %d configurations in parallel", len(pairs))
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(_validate_one, pairs))
+
     def validate_single_mapping(
         self,
         mapping: FieldMapping,
@@ -157,12 +280,13 @@ class MappingValidationService:
             ValidationError if there's an issue, None otherwise
         """
         # Check if field is updateable
-        if not salesforce_field.updateable and salesforce_field.name != 'Id':
+        if salesforce_field.warn_non_updateable:
             return ValidationError(
                 field_name=salesforce_field.name,
                 error_type='non_updateable',
-                message=f"Field '{salesforce_field.label}' is not updateable",
-                severity='warning'
+                severity='warning',
+                template=_MSG_NON_UPDATEABLE,
+                args=(salesforce_field.label, salesforce_field.name)
             )
 
         return None
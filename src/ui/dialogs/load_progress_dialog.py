@@ -122,6 +122,31 @@ class LoadProgressDialog(QDialog):
         self.error_log.show()
         self.error_log.append(f"Row {row}: {error}")
 
+    def add_errors(self, errors: list):
+        """
+        Add a batch of errors to the log in one document update.
+
+        Appending per row makes QTextEdit re-layout once per error,
+        which freezes the dialog on loads with thousands of failures;
+        joining the batch first costs a single layout pass.
+
+        Args:
+            errors: List of dicts with 'row' and 'error' keys
+        """
+        if not errors:
+            return
+
+        text = "\n".join(f"Row {e['row']}: {e['error']}" for e in errors)
+        existing = self.error_log.toPlainText()
+
+        self.error_log.setUpdatesEnabled(False)
+        try:
+            self.error_log.setPlainText(f"{existing}\n{text}" if existing else text)
+        finally:
+            self.error_log.setUpdatesEnabled(True)
+
+        self.error_log.show()
+
     def set_complete(self, successful: int, failed: int):
         """
         Mark operation as complete.
@@ -64,9 +64,11 @@ class RecordTypeDialog(QDialog):
         layout.addWidget(combo_label)
 
         self.record_type_combo = QComboBox()
-        for rt in self.record_types:
-            display_text = str(rt)  # Uses RecordType.__str__ which includes (Default) marker
-            self.record_type_combo.addItem(display_text, rt)
+        # Populate in one batch: addItems triggers a single model update
+        # instead of one rowsInserted/relayout per record type
+        self.record_type_combo.addItems([rt.display for rt in self.record_types])
+        for i, rt in enumerate(self.record_types):
+            self.record_type_combo.setItemData(i, rt, Qt.UserRole)
 
         # Select first item by default
         if self.record_types:
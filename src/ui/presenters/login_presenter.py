@@ -5,8 +5,9 @@ Orchestrates login flow between UI and business logic.
 Contains no PyQt5 dependencies - pure Python business logic.
 """
 
+import threading
 from typing import Optional
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from ...core.logging_config import get_logger
 from ...services.auth_service import AuthService
@@ -16,16 +17,21 @@ from ...models.connection import ConnectionStatus
 logger = get_logger(__name__)
 
 
-class AuthWorker(QThread):
-    """
-    Worker thread for authentication to prevent UI blocking.
-
-    Runs authentication in background thread.
-    """
+class AuthSignals(QObject):
+    """Signals for AuthWorker (QRunnable cannot define signals itself)."""
 
     finished = pyqtSignal(object)  # ConnectionStatus
     error = pyqtSignal(str)
 
+
+class AuthWorker(QRunnable):
+    """
+    Worker runnable for authentication to prevent UI blocking.
+
+    Runs authentication on a pooled thread (QThreadPool) so retries
+    reuse an existing thread instead of creating one per attempt.
+    """
+
     def __init__(self, auth_service: AuthService, username: str, password: str,
                  token: str, instance_url: str, remember: bool):
         """
@@ -40,6 +46,8 @@ class AuthWorker(QThread):
             remember: Whether to remember credentials
         """
         super().__init__()
+        self.signals = AuthSignals()
+        self._cancel_event = threading.Event()
         self.auth_service = auth_service
         self.username = username
         self.password = password
@@ -47,6 +55,10 @@ class AuthWorker(QThread):
         self.instance_url = instance_url
         self.remember = remember
 
+    def cancel(self):
+        """Request cooperative cancellation of the running attempt."""
+        self._cancel_event.set()
+
     def run(self):
         """Execute authentication in background thread."""
         try:
@@ -55,13 +67,15 @@ class AuthWorker(QThread):
                 password=self.password,
                 security_token=self.token,
                 instance_url=self.instance_url,
-                remember_credentials=self.remember
+                remember_credentials=self.remember,
+                cancel_event=self._cancel_event
             )
-            self.finished.emit(status)
+            if not self._cancel_event.is_set():
+                self.signals.finished.emit(status)
 
         except Exception as e:
-            logger.error(f"Authentication worker error: {e}")
-            self.error.emit(str(e))
+            logger.error("Authentication worker error: %s", e)
+            self.signals.error.emit(str(e))
 
 
 class LoginPresenter(QObject):
@@ -106,7 +120,7 @@ class LoginPresenter(QObject):
             instance_url: Instance URL
             remember: Whether to remember credentials
         """
-        logger.info(f"Login request received for user: {username}")
+        logger.info("Login request received for user: %s", username)
 
         # Set UI to loading state
         self.view.set_loading(True)
@@ -122,11 +136,11 @@ class LoginPresenter(QObject):
         )
 
         # Connect worker signals
-        self.auth_worker.finished.connect(self._handle_auth_result)
-        self.auth_worker.error.connect(self._handle_auth_error)
+        self.auth_worker.signals.finished.connect(self._handle_auth_result)
+        self.auth_worker.signals.error.connect(self._handle_auth_error)
 
-        # Start authentication
-        self.auth_worker.start()
+        # Start authentication on the shared pool (runnable auto-deletes)
+        QThreadPool.globalInstance().start(self.auth_worker)
 
     def _handle_auth_result(self, status: ConnectionStatus):
         """
@@ -147,16 +161,14 @@ class LoginPresenter(QObject):
             self.authentication_succeeded.emit()
 
         else:
-            logger.warning(f"Authentication failed: {status.error}")
+            logger.warning("Authentication failed: %s", status.error)
             self.view.show_status("Authentication failed", "error")
 
             error_message = status.error or "Unknown error occurred"
             self.view.show_error("Authentication Failed", error_message)
 
-        # Clean up worker
-        if self.auth_worker:
-            self.auth_worker.deleteLater()
-            self.auth_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.auth_worker = None
 
     def _handle_auth_error(self, error_message: str):
         """
@@ -165,17 +177,15 @@ class LoginPresenter(QObject):
         Args:
             error_message: Error message
         """
-        logger.error(f"Authentication error: {error_message}")
+        logger.error("Authentication error: %s", error_message)
 
         # Reset UI loading state
         self.view.set_loading(False)
         self.view.show_status("Authentication error", "error")
         self.view.show_error("Error", f"An error occurred: {error_message}")
 
-        # Clean up worker
-        if self.auth_worker:
-            self.auth_worker.deleteLater()
-            self.auth_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.auth_worker = None
 
     def _handle_load_credentials(self, username: str):
         """
@@ -184,28 +194,27 @@ class LoginPresenter(QObject):
         Args:
             username: Username to load credentials for
         """
-        logger.info(f"Checking for saved credentials: {username}")
-
-        # Check if credentials exist
-        if self.auth_service.credentials_exist(username):
-            # Load credentials
-            credentials = self.auth_service.load_saved_credentials(username)
-
-            if credentials:
-                # Auto-fill password and token fields
-                self.view.auto_fill_credentials(
-                    password=credentials.password,
-                    token=credentials.security_token
-                )
-                logger.info(f"Credentials auto-filled for user: {username}")
-            else:
-                logger.warning(f"Failed to load credentials for user: {username}")
+        logger.debug("Checking for saved credentials: %s", username)
+
+        # Load directly - a single keyring round trip; returns None when
+        # no credentials are stored for this username
+        credentials = self.auth_service.load_saved_credentials(username)
+
+        if credentials is not None:
+            # Auto-fill password and token fields
+            self.view.auto_fill_credentials(
+                password=credentials.password,
+                token=credentials.security_token
+            )
+            logger.debug("Credentials auto-filled for user: %s", username)
 
     def cleanup(self):
         """Cleanup resources when presenter is no longer needed."""
-        if self.auth_worker and self.auth_worker.isRunning():
-            self.auth_worker.terminate()
-            self.auth_worker.wait()
+        # Cooperative cancel: the worker checks the flag between network
+        # phases, so no thread is ever forcibly terminated
+        if self.auth_worker is not None:
+            self.auth_worker.cancel()
+            self.auth_worker = None
 
         if self.auth_service.is_connected():
             self.auth_service.disconnect()
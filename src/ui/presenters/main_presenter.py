@@ -4,7 +4,13 @@ Main window presenter (Presenter in MVP pattern).
 Orchestrates main window business logic.
 """
 
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+import os
+import threading
+import time
+from collections import namedtuple
+from operator import itemgetter
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from typing import Optional
 
 from ...core.logging_config import get_logger
@@ -17,227 +23,331 @@ from ...services.ai_mapping_service import AIEnhancedMappingService
 from ...services.data_loader_service import DataLoaderService, LoadResult
 from ...services.template_service import TemplateService
 from ...services.auth_service import AuthService
-from ...models.salesforce_metadata import ObjectListItem, SalesforceObject
+from ...models.salesforce_metadata import (
+    ObjectListItem, SalesforceObject,
+    FIELD_REQUIRED, FIELD_CREATEABLE, FIELD_CALCULATED, FIELD_AUTO_NUMBER
+)
 from ...models.mapping_models import SourceFile, FieldMapping
 
 
 logger = get_logger(__name__)
 
+# Normalized page-layout assignment: the raw client response has a legacy
+# dual shape (dict vs plain str); converting once at the worker boundary
+# keeps the GUI row loop a branchless two-attribute read
+LayoutInfo = namedtuple('LayoutInfo', ['name', 'id'])
+
+_DEFAULT_LAYOUT = LayoutInfo('No layout assigned', None)
+
+# A template column must be required and createable but not
+# auto-calculated; one masked compare on field.flags answers all four
+_TEMPLATE_FIELD_MASK = (
+    FIELD_REQUIRED | FIELD_CREATEABLE | FIELD_CALCULATED | FIELD_AUTO_NUMBER
+)
+_TEMPLATE_FIELD_VALUE = FIELD_REQUIRED | FIELD_CREATEABLE
+
+
+def _normalize_layout_assignments(raw: dict) -> dict:
+    """Convert raw layout assignments into record_type_id -> LayoutInfo."""
+    if not raw:
+        return {}
+    return {
+        record_type_id: (
+            LayoutInfo(value.get('name', 'No layout assigned'), value.get('id'))
+            if isinstance(value, dict) else LayoutInfo(value, None)
+        )
+        for record_type_id, value in raw.items()
+    }
 
-class MetadataLoadWorker(QThread):
-    """Worker thread for loading metadata in background."""
-
-    finished = pyqtSignal(list)  # List[ObjectListItem]
-    error = pyqtSignal(str)
 
-    def __init__(self, metadata_service: MetadataService):
-        """
-        Initialize worker.
+# Process-level mapping-service singleton: AIEnhancedMappingService can
+# load a multi-hundred-MB embedding model, so re-login or window
+# re-creation must not rebuild it unless the AI config actually changed
+_mapping_service_cache = None
+_mapping_service_cache_key = None
 
-        Args:
-            metadata_service: MetadataService instance
-        """
-        super().__init__()
-        self.metadata_service = metadata_service
 
-    def run(self):
-        """Load objects in background thread."""
-        try:
-            logger.debug("Loading objects in background thread")
-            objects = self.metadata_service.get_all_objects()
-            self.finished.emit(objects)
+def _get_mapping_service(config):
+    """
+    Return the mapping service for the given config, reusing the cached
+    instance when the AI-relevant settings are unchanged.
 
-        except Exception as e:
-            logger.error(f"Error loading objects: {e}")
-            self.error.emit(str(e))
+    Args:
+        config: AppConfig instance
 
+    Returns:
+        MappingService or AIEnhancedMappingService
+    """
+    global _mapping_service_cache, _mapping_service_cache_key
+
+    cache_key = (
+        config.use_semantic_matching,
+        config.use_llm_mapping,
+        config.llm_provider,
+        config.llm_model,
+        config.claude_api_key,
+    )
+    if _mapping_service_cache is not None and _mapping_service_cache_key == cache_key:
+        logger.debug("Reusing cached mapping service instance")
+        return _mapping_service_cache
+
+    if config.use_semantic_matching or config.use_llm_mapping:
+        logger.info(
+            f"Initializing AI-enhanced mapping service "
+            f"(semantic: {config.use_semantic_matching}, llm: {config.use_llm_mapping})"
+        )
+        service = AIEnhancedMappingService(
+            use_semantic=config.use_semantic_matching,
+            use_llm=config.use_llm_mapping,
+            llm_provider=config.llm_provider,
+            llm_model=config.llm_model,
+            api_key=config.claude_api_key
+        )
+    else:
+        logger.info("Using standard fuzzy matching service")
+        service = MappingService()
+
+    _mapping_service_cache = service
+    _mapping_service_cache_key = cache_key
+    return service
+
+
+def _coerce_csv_value(value):
+    """Coerce a preview record value into a flat CSV cell."""
+    # Fast path: the vast majority of Salesforce cells arrive as strings,
+    # so one exact type check skips the isinstance dispatch chain below
+    if type(value) is str:
+        return value
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, dict):
+        # Nested objects (lookup fields) - extract Name or Id
+        return value.get('Name', value.get('Id', str(value)))
+    return value
+
+
+def _coerce_bool_cell(value):
+    """Coerce a known-boolean column value into a CSV cell."""
+    if value is None:
+        return ''
+    return 'TRUE' if value else 'FALSE'
+
+
+def _coerce_reference_cell(value):
+    """Coerce a known-lookup column value (nested dict or ID) into a cell."""
+    if isinstance(value, dict):
+        return value.get('Name', value.get('Id', str(value)))
+    return '' if value is None else value
+
+
+def _pick_coercer(field_type):
+    """
+    Pick a per-column coercer from the field's describe type.
 
-class ObjectDescribeWorker(QThread):
-    """Worker thread for loading object describe metadata in background."""
+    Columns with a known type skip the generic isinstance dispatch: the
+    runtime type test is evaluated once per column instead of per cell.
+    """
+    if field_type == 'boolean':
+        return _coerce_bool_cell
+    if field_type in ('reference', 'masterDetail'):
+        return _coerce_reference_cell
+    return _coerce_csv_value
 
-    finished = pyqtSignal(object)  # SalesforceObject
-    error = pyqtSignal(str)
 
-    def __init__(self, metadata_service: MetadataService, object_name: str):
-        """
-        Initialize worker.
+def _csv_escape(name: str) -> str:
+    """Quote a CSV cell only when it contains a delimiter, quote, or newline."""
+    if any(ch in name for ch in ',"\r\n'):
+        return '"' + name.replace('"', '""') + '"'
+    return name
 
-        Args:
-            metadata_service: MetadataService instance
-            object_name: API name of object to describe
-        """
-        super().__init__()
-        self.metadata_service = metadata_service
-        self.object_name = object_name
-
-    def run(self):
-        """Load object describe in background thread."""
-        try:
-            logger.debug(f"Loading describe for object: {self.object_name}")
-            obj = self.metadata_service.get_object_metadata(self.object_name)
-            self.finished.emit(obj)
-
-        except Exception as e:
-            logger.error(f"Error loading object describe: {e}")
-            self.error.emit(str(e))
 
+def _write_preview_csv(file_path: str, records: list, fields: list,
+                       field_types: Optional[dict] = None) -> int:
+    """
+    Write preview records to a CSV file (runs on a pool thread).
 
-class PageLayoutWorker(QThread):
-    """Worker thread for fetching page layout fields in background."""
+    Args:
+        file_path: Destination CSV path
+        records: Preview record dicts
+        fields: Ordered export column names
+        field_types: Optional field name -> describe type map used to
+            specialize per-column value coercion
 
-    finished = pyqtSignal(list)  # List of field API names
+    Returns:
+        Number of records written
+    """
+    import csv
+
+    # itemgetter projects a whole row in C; SOQL results carry every
+    # selected field, so the per-record KeyError fallback is rare
+    if len(fields) > 1:
+        getter = itemgetter(*fields)
+    else:
+        getter = lambda record: (record.get(fields[0], ''),)
+
+    # One coercer per column, chosen from describe metadata up front
+    field_types = field_types or {}
+    coercers = [_pick_coercer(field_types.get(field)) for field in fields]
+
+    def rows():
+        for record in records:
+            try:
+                values = getter(record)
+            except KeyError:
+                values = tuple(record.get(field, '') for field in fields)
+            yield [coerce(value) for coerce, value in zip(coercers, values)]
+
+    # Plain csv.writer with list rows skips the per-row fieldname
+    # projection DictWriter does, and writerows over a generator keeps
+    # the loop on the C fast path. A 1 MiB buffer amortizes write
+    # syscalls on large exports (default text buffering is only 8 KiB)
+    with open(file_path, 'w', newline='', encoding='utf-8',
+              buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fields)
+        writer.writerows(rows())
+
+    return len(records)
+
+
+class _TaskSignals(QObject):
+    """Signals for pooled task runnables (QRunnable cannot define signals)."""
+
+    finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
-    def __init__(self, sf_client, object_name: str, record_type_id: str = None):
-        """
-        Initialize worker.
-
-        Args:
-            sf_client: SalesforceClient instance
-            object_name: Object API name
-            record_type_id: Optional record type ID
-        """
-        super().__init__()
-        self.sf_client = sf_client
-        self.object_name = object_name
-        self.record_type_id = record_type_id
-
-    def run(self):
-        """Fetch page layout fields in background thread."""
-        try:
-            logger.debug(f"Fetching page layout fields for: {self.object_name} (record type: {self.record_type_id})")
-            layout_fields = self.sf_client.get_page_layout_fields(
-                self.object_name,
-                self.record_type_id
-            )
-            self.finished.emit(layout_fields)
 
-        except Exception as e:
-            logger.error(f"Error fetching page layout: {e}")
-            self.error.emit(str(e))
+class _PreviewSignals(_TaskSignals):
+    """Task signals plus a partial-rows channel for streamed previews."""
 
+    rows = pyqtSignal(dict)  # {'records': batch, 'fields': [...]}
 
-class PageLayoutAssignmentsWorker(QThread):
-    """Worker thread for fetching page layout assignments in background."""
 
-    finished = pyqtSignal(dict)  # Dict[str, str] mapping record_type_id -> layout_name
-    error = pyqtSignal(str)
+class _TaskRunnable(QRunnable):
+    """Generic runnable that executes a callable on the shared thread pool."""
 
-    def __init__(self, sf_client, object_name: str, salesforce_object: SalesforceObject):
+    def __init__(self, fn, signals=None):
         """
-        Initialize worker.
+        Initialize runnable.
 
         Args:
-            sf_client: SalesforceClient instance
-            object_name: Object API name
-            salesforce_object: SalesforceObject with record types
+            fn: Zero-argument callable whose result is emitted via signals
+            signals: Optional signals holder (defaults to _TaskSignals)
         """
         super().__init__()
-        self.sf_client = sf_client
-        self.object_name = object_name
-        self.salesforce_object = salesforce_object
+        self.signals = signals or _TaskSignals()
+        self.fn = fn
 
     def run(self):
-        """Fetch page layout assignments in background thread."""
+        """Execute the callable and report the result or error."""
         try:
-            logger.debug(f"Fetching page layout assignments for: {self.object_name}")
-
-            # Pass full record types list to enable name-to-ID matching
-            layout_assignments = self.sf_client.get_page_layout_assignments(
-                self.object_name,
-                self.salesforce_object.record_types
-            )
-            self.finished.emit(layout_assignments)
-
+            self.signals.finished.emit(self.fn())
         except Exception as e:
-            logger.error(f"Error fetching page layout assignments: {e}")
-            self.error.emit(str(e))
+            logger.error(f"Task runnable error: {e}")
+            self.signals.error.emit(str(e))
 
 
-class DataPreviewWorker(QThread):
-    """Worker thread for loading sample data in background."""
+class ParallelMetadataFetcher(QObject):
+    """
+    Dispatches the metadata fetches for one object selection off the UI
+    thread.
+
+    The describe is issued first and the page-layout assignments fetch
+    is chained off its completion, because the assignments call needs
+    the record types the describe returns. Re-selections hit the
+    describe cache, so in the common case the layouts request still
+    starts with no perceptible delay.
+    """
 
-    finished = pyqtSignal(dict)  # Dictionary with records, fields, total_size
-    error = pyqtSignal(str)
+    describe_ready = pyqtSignal(object)        # SalesforceObject
+    layouts_ready = pyqtSignal(dict, object)   # assignments, SalesforceObject
+    describe_error = pyqtSignal(str)
+    layouts_error = pyqtSignal(str)
 
-    def __init__(
-        self,
-        data_preview_service: DataPreviewService,
-        salesforce_object: SalesforceObject,
-        record_type_id: str = None,
-        layout_fields: list = None
-    ):
+    def __init__(self, metadata_service: MetadataService, sf_client, parent=None):
         """
-        Initialize worker.
+        Initialize fetcher.
 
         Args:
-            data_preview_service: DataPreviewService instance
-            salesforce_object: SalesforceObject to preview
-            record_type_id: Optional record type ID to filter by
-            layout_fields: Optional list of fields from page layout
+            metadata_service: MetadataService instance
+            sf_client: SalesforceClient instance
+            parent: Parent QObject
         """
-        super().__init__()
-        self.data_preview_service = data_preview_service
-        self.salesforce_object = salesforce_object
-        self.record_type_id = record_type_id
-        self.layout_fields = layout_fields
-
-    def run(self):
-        """Load sample data in background thread."""
-        try:
-            logger.debug(f"Loading sample data for: {self.salesforce_object.name}")
-            data = self.data_preview_service.get_sample_data_for_object(
-                self.salesforce_object,
-                limit=20,
-                include_all_required=(not self.layout_fields),  # Use all required if no layout
-                record_type_id=self.record_type_id,
-                layout_fields=self.layout_fields
-            )
-            self.finished.emit(data)
-
-        except Exception as e:
-            logger.error(f"Error loading sample data: {e}")
-            self.error.emit(str(e))
-
-
-class FileImportWorker(QThread):
-    """Worker thread for importing CSV/Excel files in background."""
-
-    finished = pyqtSignal(object)  # SourceFile
-    error = pyqtSignal(str)
+        super().__init__(parent)
+        self.metadata_service = metadata_service
+        self.sf_client = sf_client
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(8)
+        self._object_name: Optional[str] = None
+        self._describe_result: Optional[SalesforceObject] = None
 
-    def __init__(self, file_import_service: FileImportService, file_path: str):
+    def fetch(self, object_name: str):
         """
-        Initialize worker.
+        Start the metadata fetches for an object.
 
         Args:
-            file_import_service: FileImportService instance
-            file_path: Path to file to import
+            object_name: API name of the selected object
         """
-        super().__init__()
-        self.file_import_service = file_import_service
-        self.file_path = file_path
+        self._object_name = object_name
+        self._describe_result = None
 
-    def run(self):
-        """Import file in background thread."""
-        try:
-            logger.debug(f"Importing file: {self.file_path}")
-            source_file = self.file_import_service.import_file(self.file_path, sample_size=100)
-            self.finished.emit(source_file)
-
-        except Exception as e:
-            logger.error(f"Error importing file: {e}")
-            self.error.emit(str(e))
+        describe_task = _TaskRunnable(
+            lambda: self.metadata_service.get_object_metadata_cached(object_name)
+        )
+        describe_task.signals.finished.connect(self._on_describe_finished)
+        describe_task.signals.error.connect(self.describe_error)
+        self.pool.start(describe_task)
+
+    def covers(self, object_name: str) -> bool:
+        """Check whether a fetch for this object is in flight or done."""
+        return object_name == self._object_name
+
+    def _on_describe_finished(self, salesforce_object):
+        """Forward the describe, then fetch layouts for its record types."""
+        if salesforce_object.name != self._object_name:
+            return  # Stale result from a superseded selection
+        self._describe_result = salesforce_object
+        self.describe_ready.emit(salesforce_object)
+
+        record_types = salesforce_object.record_types
+        if not record_types:
+            return  # No record type rows to assign layouts to
+
+        object_name = salesforce_object.name
+        layouts_task = _TaskRunnable(
+            lambda: self.sf_client.get_page_layout_assignments(
+                object_name, record_types
+            )
+        )
+        layouts_task.signals.finished.connect(
+            lambda assignments: self._on_layouts_finished(object_name, assignments)
+        )
+        layouts_task.signals.error.connect(self.layouts_error)
+        self.pool.start(layouts_task)
+
+    def _on_layouts_finished(self, object_name, assignments):
+        """Pair the assignments with the describe they were fetched for."""
+        if object_name != self._object_name:
+            return  # Stale result from a superseded selection
+        self.layouts_ready.emit(
+            _normalize_layout_assignments(assignments), self._describe_result
+        )
 
 
-class DataLoadWorker(QThread):
-    """Worker thread for loading data to Salesforce in background."""
+class DataLoadSignals(QObject):
+    """Signals for DataLoadWorker (QRunnable cannot define signals itself)."""
 
     progress = pyqtSignal(int, int, int)  # current, successful, failed
     status = pyqtSignal(str)  # Status message for bulk API progress
     finished = pyqtSignal(object)  # LoadResult
     error = pyqtSignal(str)
 
+
+class DataLoadWorker(QRunnable):
+    """Worker runnable for loading data to Salesforce in background."""
+
     def __init__(self, data_loader_service: DataLoaderService, source_file: SourceFile,
                  mappings: list, salesforce_object: SalesforceObject, operation: str = 'insert',
                  record_type_id: str = None):
@@ -253,6 +363,7 @@ class DataLoadWorker(QThread):
             record_type_id: Optional record type ID for records
         """
         super().__init__()
+        self.signals = DataLoadSignals()
         self.data_loader_service = data_loader_service
         self.source_file = source_file
         self.mappings = mappings
@@ -260,13 +371,38 @@ class DataLoadWorker(QThread):
         self.operation = operation
         self.record_type_id = record_type_id
 
+        # Rate-limit timestamps: per-row callbacks on large loads would
+        # otherwise queue a cross-thread Qt event per record
+        self._last_progress_ts = 0.0
+        self._last_status_ts = 0.0
+
+        # Cooperative cancellation: the loader checks this between
+        # records, so the thread is never forcibly terminated
+        self._cancel_event = threading.Event()
+
+    def request_stop(self):
+        """Request cooperative cancellation of the running load."""
+        self._cancel_event.set()
+
     def _status_callback(self, message: str):
         """Callback for status messages from data loader (Bulk API)."""
-        self.status.emit(message)
+        now = time.monotonic()
+        if now - self._last_status_ts < 0.2:
+            return
+        self._last_status_ts = now
+        self.signals.status.emit(message)
 
     def _progress_callback(self, current: int, successful: int, failed: int, total: int):
-        """Callback for numeric progress updates from data loader (REST API)."""
-        self.progress.emit(current, successful, failed)
+        """Callback for numeric progress updates from data loader (REST API).
+
+        Emits at most ~20 Hz; the final tick (current == total) always
+        passes so the dialog ends at 100%.
+        """
+        now = time.monotonic()
+        if current != total and now - self._last_progress_ts < 0.05:
+            return
+        self._last_progress_ts = now
+        self.signals.progress.emit(current, successful, failed)
 
     def _unified_progress_callback(self, *args):
         """
@@ -293,13 +429,15 @@ class DataLoadWorker(QThread):
                 self.salesforce_object,
                 self.operation,
                 self.record_type_id,
-                progress_callback=self._unified_progress_callback
+                progress_callback=self._unified_progress_callback,
+                cancel_event=self._cancel_event
             )
-            self.finished.emit(result)
+            if not self._cancel_event.is_set():
+                self.signals.finished.emit(result)
 
         except Exception as e:
             logger.error(f"Error loading data: {e}")
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class MainPresenter(QObject):
@@ -329,34 +467,64 @@ class MainPresenter(QObject):
         self.data_preview_service = DataPreviewService(self.sf_client)
         self.file_import_service = FileImportService()
 
-        # Initialize AI-enhanced mapping service with config
+        # Mapping service is a process-level singleton keyed on the AI
+        # settings, so re-opening the window reuses any loaded models
         self.config_manager = ConfigManager()
         config = self.config_manager.load()
-
-        # Use AI-enhanced mapping service if enabled, otherwise fallback to basic
-        if config.use_semantic_matching or config.use_llm_mapping:
-            logger.info(
-                f"Initializing AI-enhanced mapping service "
-                f"(semantic: {config.use_semantic_matching}, llm: {config.use_llm_mapping})"
-            )
-            self.mapping_service = AIEnhancedMappingService(
-                use_semantic=config.use_semantic_matching,
-                use_llm=config.use_llm_mapping,
-                llm_provider=config.llm_provider,
-                llm_model=config.llm_model,
-                api_key=config.claude_api_key
-            )
-        else:
-            logger.info("Using standard fuzzy matching service")
-            self.mapping_service = MappingService()
+        self.mapping_service = _get_mapping_service(config)
 
         self.data_loader_service = DataLoaderService(auth_service.get_client())
         self.template_service = TemplateService()
-        self.worker: Optional[MetadataLoadWorker] = None
-        self.describe_worker: Optional[ObjectDescribeWorker] = None
-        self.preview_worker: Optional[DataPreviewWorker] = None
-        self.import_worker: Optional[FileImportWorker] = None
+
+        # Shared thread pool: all per-action work runs on reused pool
+        # threads instead of a freshly created QThread per click
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(6)
+        self.worker: Optional[_TaskRunnable] = None
+        self.preview_worker: Optional[_TaskRunnable] = None
+        self.import_worker: Optional[_TaskRunnable] = None
+        self.export_worker: Optional[_TaskRunnable] = None
+        self.layout_fields_worker: Optional[_TaskRunnable] = None
+        self.auto_map_worker: Optional[_TaskRunnable] = None
         self.load_worker: Optional[DataLoadWorker] = None
+        self._preview_rows_streamed = 0
+
+        # In-flight request keys (worker_type, object_name): rapid repeat
+        # clicks short-circuit instead of dispatching duplicate fetches
+        # that leak workers and double-charge API limits
+        self._inflight: set = set()
+
+        # Layout fields already fetched this session, keyed by
+        # (object_name, record_type_id); repeat previews skip the
+        # layout round-trip entirely
+        self._layout_fields_cache: dict = {}
+
+        # Last directory picked per file-dialog action; seeding the
+        # dialog avoids re-statting cwd and drops the user back where
+        # they saved last time (matters on network drives)
+        self._last_mapping_dir: str = ''
+        self._last_template_dir: str = ''
+        self._last_export_dir: str = ''
+
+        # Concurrent dispatcher for the per-object metadata round-trips
+        self.metadata_fetcher = ParallelMetadataFetcher(
+            metadata_service, self.sf_client, self
+        )
+        self.metadata_fetcher.describe_ready.connect(self._on_object_describe_loaded)
+        self.metadata_fetcher.layouts_ready.connect(self._on_page_layout_assignments_loaded)
+        self.metadata_fetcher.describe_error.connect(self._on_describe_error)
+        self.metadata_fetcher.layouts_error.connect(self._on_page_layout_assignments_error)
+
+        # Hover prefetch: warm the describe cache for the object under the
+        # cursor so the click that follows usually finds it resident.
+        # A short single-shot debounce keeps fast mouse sweeps from
+        # submitting a fetch per item crossed
+        self._hovered_object_name: Optional[str] = None
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(150)
+        self._prefetch_timer.timeout.connect(self._prefetch_hovered_object)
+        self.view.object_list_widget.object_hovered.connect(self._handle_object_hovered)
 
         # Connect view signals
         self.view.object_selected.connect(self._handle_object_selected)
@@ -384,11 +552,11 @@ class MainPresenter(QObject):
         self.view.object_list_widget.show_loading(True)
         self.view.update_status("Loading Salesforce objects...")
 
-        # Create and start worker thread
-        self.worker = MetadataLoadWorker(self.metadata_service)
-        self.worker.finished.connect(self._on_objects_loaded)
-        self.worker.error.connect(self._on_load_error)
-        self.worker.start()
+        # Submit to the shared pool
+        self.worker = _TaskRunnable(self.metadata_service.get_all_objects)
+        self.worker.signals.finished.connect(self._on_objects_loaded)
+        self.worker.signals.error.connect(self._on_load_error)
+        self.pool.start(self.worker)
 
     def _on_objects_loaded(self, objects: list):
         """
@@ -404,10 +572,8 @@ class MainPresenter(QObject):
         self.view.object_list_widget.set_objects(objects)
         self.view.update_status(f"Loaded {len(objects)} objects")
 
-        # Cleanup worker
-        if self.worker:
-            self.worker.deleteLater()
-            self.worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.worker = None
 
     def _on_load_error(self, error_message: str):
         """
@@ -426,10 +592,8 @@ class MainPresenter(QObject):
         )
         self.view.update_status("Error loading objects")
 
-        # Cleanup worker
-        if self.worker:
-            self.worker.deleteLater()
-            self.worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.worker = None
 
     def _handle_object_selected(self, object_name: str):
         """
@@ -440,15 +604,24 @@ class MainPresenter(QObject):
         """
         logger.info(f"Object selected: {object_name}")
 
+        # Ignore repeat clicks while the same object's metadata is in flight
+        key = ('describe', object_name)
+        if key in self._inflight:
+            logger.debug(f"Describe for {object_name} already in flight")
+            return
+
+        # A new selection supersedes any earlier one; the fetcher drops
+        # stale results silently, so their keys must be dropped here too
+        self._inflight = {k for k in self._inflight if k[0] != 'describe'}
+        self._inflight.add(key)
+
         # Show loading state
         self.view.object_detail_widget.show_loading()
         self.view.update_status(f"Loading metadata for {object_name}...")
 
-        # Create and start worker thread
-        self.describe_worker = ObjectDescribeWorker(self.metadata_service, object_name)
-        self.describe_worker.finished.connect(self._on_object_describe_loaded)
-        self.describe_worker.error.connect(self._on_describe_error)
-        self.describe_worker.start()
+        # Dispatch describe + layout assignments in parallel; results come
+        # back via the fetcher signals connected in __init__
+        self.metadata_fetcher.fetch(object_name)
 
     def _on_object_describe_loaded(self, salesforce_object: SalesforceObject):
         """
@@ -458,6 +631,7 @@ class MainPresenter(QObject):
             salesforce_object: SalesforceObject with full metadata
         """
         logger.info(f"Loaded metadata for: {salesforce_object.name}")
+        self._inflight.discard(('describe', salesforce_object.name))
 
         # Update view
         self.view.object_detail_widget.set_object(salesforce_object)
@@ -465,11 +639,6 @@ class MainPresenter(QObject):
             f"Loaded {salesforce_object.label} ({len(salesforce_object.fields)} fields)"
         )
 
-        # Cleanup worker
-        if self.describe_worker:
-            self.describe_worker.deleteLater()
-            self.describe_worker = None
-
     def _on_describe_error(self, error_message: str):
         """
         Handle error loading object describe.
@@ -478,6 +647,7 @@ class MainPresenter(QObject):
             error_message: Error message
         """
         logger.error(f"Failed to load object describe: {error_message}")
+        self._inflight = {k for k in self._inflight if k[0] != 'describe'}
 
         # Update view
         self.view.object_detail_widget.clear()
@@ -487,11 +657,6 @@ class MainPresenter(QObject):
         )
         self.view.update_status("Error loading object metadata")
 
-        # Cleanup worker
-        if self.describe_worker:
-            self.describe_worker.deleteLater()
-            self.describe_worker = None
-
     def _handle_load_preview_data(self):
         """Handle request to load preview data for current object."""
         current_object = self.view.object_detail_widget.current_object
@@ -502,95 +667,88 @@ class MainPresenter(QObject):
         # Get selected record type from widget
         record_type_id = self.view.object_detail_widget.data_preview_widget.get_selected_record_type_id()
 
+        # Ignore repeat clicks while the same preview request is in flight
+        key = ('preview', current_object.name, record_type_id)
+        if key in self._inflight:
+            logger.debug(f"Preview for {current_object.name} already in flight")
+            return
+        self._inflight.add(key)
+
         logger.info(f"Loading preview data for: {current_object.name} (record type: {record_type_id or 'all'})")
 
         # Show loading state
         self.view.object_detail_widget.data_preview_widget.show_loading()
         self.view.update_status(f"Loading sample data for {current_object.label}...")
 
-        # If a record type is selected, fetch page layout fields first
-        if record_type_id:
-            logger.info(f"Fetching page layout fields for record type: {record_type_id}")
-            self.view.update_status(f"Fetching page layout...")
-
-            # Create and start page layout worker
-            self.layout_worker = PageLayoutWorker(
-                self.sf_client,
-                current_object.name,
-                record_type_id
-            )
-            self.layout_worker.finished.connect(
-                lambda layout_fields: self._on_layout_fields_loaded(
-                    layout_fields, current_object, record_type_id
-                )
-            )
-            self.layout_worker.error.connect(
-                lambda error: self._on_layout_error(error, current_object, record_type_id)
-            )
-            self.layout_worker.start()
-        else:
-            # No record type selected, load with default field selection
-            self._load_preview_data(current_object, record_type_id, layout_fields=None)
+        # One pooled task performs the layout fetch (when a record type is
+        # selected) and the sample query back to back, so the UI thread
+        # gets a single combined result instead of hopping between two
+        # workers mid-pipeline. Partial row batches stream through the
+        # rows signal so large previews paint incrementally
+        self._preview_rows_streamed = 0
+        signals = _PreviewSignals()
+        self.preview_worker = _TaskRunnable(
+            lambda: self._fetch_preview_with_layout(
+                current_object, record_type_id, signals.rows.emit
+            ),
+            signals=signals
+        )
+        self.preview_worker.signals.rows.connect(self._on_preview_rows)
+        self.preview_worker.signals.finished.connect(self._on_preview_data_loaded)
+        self.preview_worker.signals.error.connect(self._on_preview_error)
+        self.pool.start(self.preview_worker)
 
-    def _on_layout_fields_loaded(self, layout_fields: list, salesforce_object, record_type_id):
+    def _on_preview_rows(self, data: dict):
         """
-        Handle page layout fields loaded successfully.
+        Handle a partial batch of streamed preview rows.
 
         Args:
-            layout_fields: List of field API names from page layout
-            salesforce_object: SalesforceObject to preview
-            record_type_id: Record type ID
-        """
-        logger.info(f"Loaded {len(layout_fields)} fields from page layout")
-
-        # Cleanup worker
-        if hasattr(self, 'layout_worker') and self.layout_worker:
-            self.layout_worker.deleteLater()
-            self.layout_worker = None
-
-        # Now load preview data with these fields
-        self._load_preview_data(salesforce_object, record_type_id, layout_fields)
-
-    def _on_layout_error(self, error_message: str, salesforce_object, record_type_id):
+            data: Dictionary with 'records' (batch) and 'fields'
         """
-        Handle error loading page layout fields.
+        self._preview_rows_streamed += len(data.get('records', []))
+        self.view.object_detail_widget.data_preview_widget.append_rows(data)
 
-        Args:
-            error_message: Error message
-            salesforce_object: SalesforceObject to preview
-            record_type_id: Record type ID
+    def _fetch_preview_with_layout(self, salesforce_object, record_type_id, chunk_callback=None):
         """
-        logger.warning(f"Failed to load page layout, using default fields: {error_message}")
-
-        # Cleanup worker
-        if hasattr(self, 'layout_worker') and self.layout_worker:
-            self.layout_worker.deleteLater()
-            self.layout_worker = None
+        Fetch page layout fields (if applicable) and sample data in one pass.
 
-        # Fall back to loading with default field selection
-        self._load_preview_data(salesforce_object, record_type_id, layout_fields=None)
-
-    def _load_preview_data(self, salesforce_object, record_type_id, layout_fields):
-        """
-        Load preview data with specified parameters.
+        Runs on a pool thread. The sample query's field list depends on the
+        layout response, so the two requests are pipelined here instead of
+        round-tripping through the UI thread between them.
 
         Args:
             salesforce_object: SalesforceObject to preview
             record_type_id: Optional record type ID
-            layout_fields: Optional list of fields from page layout
+            chunk_callback: Optional callable receiving partial row batches
+
+        Returns:
+            Dictionary with records, fields, and total_size
         """
-        self.view.update_status(f"Loading sample data...")
+        layout_fields = None
+        if record_type_id:
+            cache_key = (salesforce_object.name, record_type_id)
+            layout_fields = self._layout_fields_cache.get(cache_key)
+            if layout_fields is None:
+                logger.info(f"Fetching page layout fields for record type: {record_type_id}")
+                try:
+                    layout_fields = self.sf_client.get_page_layout_fields(
+                        salesforce_object.name, record_type_id
+                    ) or None
+                except Exception as e:
+                    logger.warning(f"Failed to load page layout, using default fields: {e}")
+                if layout_fields:
+                    self._layout_fields_cache[cache_key] = layout_fields
+            else:
+                logger.debug(f"Layout fields cache hit for {cache_key}")
 
-        # Create and start data preview worker
-        self.preview_worker = DataPreviewWorker(
-            self.data_preview_service,
+        return self.data_preview_service.get_sample_data_for_object(
             salesforce_object,
-            record_type_id,
-            layout_fields
+            limit=20,
+            include_all_required=(not layout_fields),
+            record_type_id=record_type_id,
+            layout_fields=layout_fields,
+            chunk_callback=chunk_callback
         )
-        self.preview_worker.finished.connect(self._on_preview_data_loaded)
-        self.preview_worker.error.connect(self._on_preview_error)
-        self.preview_worker.start()
 
     def _on_preview_data_loaded(self, data: dict):
         """
@@ -601,15 +759,19 @@ class MainPresenter(QObject):
         """
         record_count = len(data.get('records', []))
         logger.info(f"Loaded {record_count} sample records")
+        self._inflight = {k for k in self._inflight if k[0] != 'preview'}
 
-        # Update view
-        self.view.object_detail_widget.data_preview_widget.set_data(data)
+        # Update view - streamed rows are already in the table, so only
+        # finalize (labels, export button, column sizing) in that case
+        preview_widget = self.view.object_detail_widget.data_preview_widget
+        if self._preview_rows_streamed:
+            preview_widget.finalize_data(data)
+        else:
+            preview_widget.set_data(data)
         self.view.update_status(f"Loaded {record_count} sample records")
 
-        # Cleanup worker
-        if self.preview_worker:
-            self.preview_worker.deleteLater()
-            self.preview_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.preview_worker = None
 
     def _on_preview_error(self, error_message: str):
         """
@@ -619,20 +781,18 @@ class MainPresenter(QObject):
             error_message: Error message
         """
         logger.error(f"Failed to load preview data: {error_message}")
+        self._inflight = {k for k in self._inflight if k[0] != 'preview'}
 
         # Update view
         self.view.object_detail_widget.data_preview_widget.show_error(error_message)
         self.view.update_status("Error loading preview data")
 
-        # Cleanup worker
-        if self.preview_worker:
-            self.preview_worker.deleteLater()
-            self.preview_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.preview_worker = None
 
     def _handle_export_preview_data(self):
         """Handle request to export preview data to CSV."""
-        from PyQt5.QtWidgets import QFileDialog, QMessageBox
-        import csv
+        from PyQt5.QtWidgets import QFileDialog
 
         # Get current object and data
         current_object = self.view.object_detail_widget.current_object
@@ -656,63 +816,74 @@ class MainPresenter(QObject):
         file_path, _ = QFileDialog.getSaveFileName(
             self.view,
             "Export Preview Data",
-            default_filename,
+            os.path.join(self._last_export_dir, default_filename),
             "CSV Files (*.csv)"
         )
 
         if not file_path:
             return
+        self._last_export_dir = os.path.dirname(file_path)
+
+        # Get data from preview widget
+        data = preview_widget.current_data
+        records = data.get('records', [])
+        fields = data.get('fields', [])
+
+        # Write on a pool thread so large exports never freeze the window
+        self.view.update_status(f"Exporting {len(records)} records to CSV...")
+        field_types = {f.name: f.type for f in current_object.fields}
+        self.export_worker = _TaskRunnable(
+            lambda: _write_preview_csv(file_path, records, fields, field_types)
+        )
+        self.export_worker.signals.finished.connect(
+            lambda count: self._on_export_finished(count, file_path, len(fields))
+        )
+        self.export_worker.signals.error.connect(self._on_export_error)
+        self.pool.start(self.export_worker)
 
-        try:
-            # Get data from preview widget
-            data = preview_widget.current_data
-            records = data.get('records', [])
-            fields = data.get('fields', [])
-
-            # Write to CSV
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fields)
-                writer.writeheader()
-
-                # Write records
-                for record in records:
-                    # Extract only the fields we want (ignore nested objects)
-                    row = {}
-                    for field in fields:
-                        value = record.get(field, '')
-                        # Handle None values
-                        if value is None:
-                            row[field] = ''
-                        # Handle boolean values
-                        elif isinstance(value, bool):
-                            row[field] = 'TRUE' if value else 'FALSE'
-                        # Handle nested objects (lookup fields) - extract Name or Id
-                        elif isinstance(value, dict):
-                            row[field] = value.get('Name', value.get('Id', str(value)))
-                        else:
-                            row[field] = value
-                    writer.writerow(row)
-
-            logger.info(f"Exported {len(records)} records to: {file_path}")
+    def _on_export_finished(self, record_count: int, file_path: str, field_count: int):
+        """
+        Handle preview export completed successfully.
 
-            # Show success message
-            QMessageBox.information(
-                self.view,
-                "Export Successful",
-                f"Successfully exported {len(records)} records to CSV!\n\n"
-                f"File: {file_path}\n"
-                f"Fields: {len(fields)}\n"
-                f"Records: {len(records)}"
-            )
+        Args:
+            record_count: Number of records written
+            file_path: Destination CSV path
+            field_count: Number of exported columns
+        """
+        from PyQt5.QtWidgets import QMessageBox
 
-            self.view.update_status(f"Exported {len(records)} records to CSV")
+        logger.info(f"Exported {record_count} records to: {file_path}")
 
-        except Exception as e:
-            logger.error(f"Error exporting preview data: {e}")
-            self.view.show_error(
-                "Export Failed",
-                f"Failed to export preview data:\n{str(e)}"
-            )
+        # Show success message
+        QMessageBox.information(
+            self.view,
+            "Export Successful",
+            f"Successfully exported {record_count} records to CSV!\n\n"
+            f"File: {file_path}\n"
+            f"Fields: {field_count}\n"
+            f"Records: {record_count}"
+        )
+
+        self.view.update_status(f"Exported {record_count} records to CSV")
+
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.export_worker = None
+
+    def _on_export_error(self, error_message: str):
+        """
+        Handle error during preview export.
+
+        Args:
+            error_message: Error message
+        """
+        logger.error(f"Error exporting preview data: {error_message}")
+        self.view.show_error(
+            "Export Failed",
+            f"Failed to export preview data:\n{error_message}"
+        )
+
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.export_worker = None
 
     def _handle_load_page_layouts(self, object_name: str):
         """
@@ -730,19 +901,34 @@ class MainPresenter(QObject):
             logger.info(f"No record types for {object_name}, skipping page layout fetch")
             return
 
+        # The metadata fetcher chains this request off its describe; its
+        # layouts_ready signal will deliver the assignments
+        if self.metadata_fetcher.covers(object_name):
+            logger.debug(f"Layout assignments for {object_name} already in flight")
+            return
+
+        # Ignore duplicate requests while one is already in flight
+        key = ('layout_assignments', object_name)
+        if key in self._inflight:
+            logger.debug(f"Layout assignments for {object_name} already in flight")
+            return
+        self._inflight.add(key)
+
         logger.info(f"Loading page layout assignments for: {object_name}")
 
-        # Create and start page layout assignments worker
-        self.page_layout_assignments_worker = PageLayoutAssignmentsWorker(
-            self.sf_client,
-            object_name,
-            current_object
+        # Submit page layout assignments fetch to the shared pool
+        self.page_layout_assignments_worker = _TaskRunnable(
+            lambda: _normalize_layout_assignments(
+                self.sf_client.get_page_layout_assignments(
+                    object_name, current_object.record_types
+                )
+            )
         )
-        self.page_layout_assignments_worker.finished.connect(
+        self.page_layout_assignments_worker.signals.finished.connect(
             lambda assignments: self._on_page_layout_assignments_loaded(assignments, current_object)
         )
-        self.page_layout_assignments_worker.error.connect(self._on_page_layout_assignments_error)
-        self.page_layout_assignments_worker.start()
+        self.page_layout_assignments_worker.signals.error.connect(self._on_page_layout_assignments_error)
+        self.pool.start(self.page_layout_assignments_worker)
 
     def _on_page_layout_assignments_loaded(self, layout_assignments: dict, salesforce_object: SalesforceObject):
         """
@@ -753,23 +939,25 @@ class MainPresenter(QObject):
             salesforce_object: SalesforceObject with record types
         """
         logger.info(f"Page layout assignments loaded for {salesforce_object.name}: {len(layout_assignments)} assignments")
+        self._inflight.discard(('layout_assignments', salesforce_object.name))
 
         # Update relationship widget with page layout information
         relationship_widget = self.view.object_detail_widget.relationship_table_widget
 
-        # Update each row with its page layout name and ID
-        for row, record_type in enumerate(sorted(salesforce_object.record_types, key=lambda rt: (not rt.is_default, rt.name))):
-            layout_info = layout_assignments.get(record_type.record_type_id, {'name': "No layout assigned", 'id': None})
-            layout_name = layout_info.get('name', 'No layout assigned') if isinstance(layout_info, dict) else layout_info
-            layout_id = layout_info.get('id') if isinstance(layout_info, dict) else None
-            relationship_widget.update_page_layout_for_row(row, layout_name, layout_id)
+        # Update all rows in one batched pass (assignments are normalized
+        # LayoutInfo tuples at the worker boundary); rows stream through
+        # a generator - no intermediate dict - and the widget repaints
+        # once instead of per row
+        assignments_get = layout_assignments.get
+        relationship_widget.bulk_update_layouts(
+            (row, assignments_get(record_type.record_type_id, _DEFAULT_LAYOUT))
+            for row, record_type in enumerate(salesforce_object.get_record_types_sorted())
+        )
 
         logger.info(f"Updated {len(salesforce_object.record_types)} record type rows with page layout names")
 
-        # Cleanup worker
-        if hasattr(self, 'page_layout_assignments_worker'):
-            self.page_layout_assignments_worker.deleteLater()
-            self.page_layout_assignments_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.page_layout_assignments_worker = None
 
     def _on_page_layout_assignments_error(self, error_message: str):
         """
@@ -779,16 +967,15 @@ class MainPresenter(QObject):
             error_message: Error message
         """
         logger.error(f"Failed to load page layout assignments: {error_message}")
+        self._inflight = {k for k in self._inflight if k[0] != 'layout_assignments'}
 
         # Update rows with error message
         relationship_widget = self.view.object_detail_widget.relationship_table_widget
         for row in range(relationship_widget.record_types_table.rowCount()):
             relationship_widget.update_page_layout_for_row(row, "Error loading layout")
 
-        # Cleanup worker
-        if hasattr(self, 'page_layout_assignments_worker'):
-            self.page_layout_assignments_worker.deleteLater()
-            self.page_layout_assignments_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.page_layout_assignments_worker = None
 
     def _handle_layout_clicked(self, record_type_id: str, layout_id: str):
         """
@@ -811,41 +998,64 @@ class MainPresenter(QObject):
                 logger.warning("No layout ID provided")
                 return
 
-            # Get layout fields from the Salesforce client
-            layout_field_names = self.sf_client.get_layout_fields(layout_id)
+            # Extract layout fields on the pool - the parse can fall back
+            # to network fetches and must not run on the GUI thread
+            self.layout_fields_worker = _TaskRunnable(
+                lambda: self.sf_client.get_layout_fields(layout_id)
+            )
+            self.layout_fields_worker.signals.finished.connect(
+                lambda names: self._on_layout_fields_filtered(names, layout_id)
+            )
+            self.layout_fields_worker.signals.error.connect(self._on_layout_fields_filter_error)
+            self.pool.start(self.layout_fields_worker)
 
-            if not layout_field_names:
-                logger.warning(f"No fields found for layout {layout_id}")
-                self.view.update_status(f"No fields found on this layout")
-                return
+        except Exception as e:
+            logger.error(f"Error handling layout click: {e}", exc_info=True)
+            self.view.update_status(f"Error filtering layout fields: {e}")
 
-            # Get the layout name from the layout assignments
-            relationship_widget = self.view.object_detail_widget.relationship_table_widget
+    def _on_layout_fields_filtered(self, layout_field_names: list, layout_id: str):
+        """
+        Apply the layout field filter once the worker delivers the fields.
 
-            # Find the layout name by searching through the stored data
-            layout_name = "Selected Layout"
-            for row in range(relationship_widget.record_types_table.rowCount()):
-                if row in relationship_widget.record_type_data:
-                    rt_id, stored_layout_id = relationship_widget.record_type_data[row]
-                    if stored_layout_id == layout_id:
-                        layout_item = relationship_widget.record_types_table.item(row, 1)
-                        if layout_item:
-                            layout_name = layout_item.text()
-                        break
+        Args:
+            layout_field_names: Field API names on the clicked layout
+            layout_id: ID of the page layout
+        """
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.layout_fields_worker = None
 
-            # Filter the fields tab to show only fields on this layout
-            field_table_widget = self.view.object_detail_widget.field_table_widget
-            field_table_widget.filter_by_layout_fields(layout_field_names, layout_name)
+        if not layout_field_names:
+            logger.warning(f"No fields found for layout {layout_id}")
+            self.view.update_status(f"No fields found on this layout")
+            return
 
-            # Switch to the Fields tab to show the filtered results
-            self.view.object_detail_widget.tabs.setCurrentIndex(0)  # Fields tab is index 0
+        # Resolve the layout name via the widget's reverse lookup -
+        # O(1) and no per-row Qt item traffic
+        relationship_widget = self.view.object_detail_widget.relationship_table_widget
+        layout_name = relationship_widget.layout_id_to_name.get(layout_id, "Selected Layout")
 
-            logger.info(f"Filtered to {len(layout_field_names)} fields on layout {layout_name}")
-            self.view.update_status(f"Showing {len(layout_field_names)} fields from layout: {layout_name}")
+        # Filter the fields tab to show only fields on this layout
+        field_table_widget = self.view.object_detail_widget.field_table_widget
+        field_table_widget.filter_by_layout_fields(layout_field_names, layout_name)
 
-        except Exception as e:
-            logger.error(f"Error handling layout click: {e}", exc_info=True)
-            self.view.update_status(f"Error filtering layout fields: {e}")
+        # Switch to the Fields tab to show the filtered results
+        self.view.object_detail_widget.tabs.setCurrentIndex(0)  # Fields tab is index 0
+
+        logger.info(f"Filtered to {len(layout_field_names)} fields on layout {layout_name}")
+        self.view.update_status(f"Showing {len(layout_field_names)} fields from layout: {layout_name}")
+
+    def _on_layout_fields_filter_error(self, error_message: str):
+        """
+        Handle error extracting layout fields for the filter.
+
+        Args:
+            error_message: Error message
+        """
+        logger.error(f"Error filtering layout fields: {error_message}")
+        self.view.update_status(f"Error filtering layout fields: {error_message}")
+
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.layout_fields_worker = None
 
     def _handle_file_import(self, file_path: str):
         """
@@ -860,11 +1070,13 @@ class MainPresenter(QObject):
         self.view.object_detail_widget.mapping_widget.show_loading()
         self.view.update_status(f"Importing file...")
 
-        # Create and start worker thread
-        self.import_worker = FileImportWorker(self.file_import_service, file_path)
-        self.import_worker.finished.connect(self._on_file_imported)
-        self.import_worker.error.connect(self._on_import_error)
-        self.import_worker.start()
+        # Submit file import to the shared pool
+        self.import_worker = _TaskRunnable(
+            lambda: self.file_import_service.import_file(file_path, sample_size=100)
+        )
+        self.import_worker.signals.finished.connect(self._on_file_imported)
+        self.import_worker.signals.error.connect(self._on_import_error)
+        self.pool.start(self.import_worker)
 
     def _on_file_imported(self, source_file: SourceFile):
         """
@@ -881,10 +1093,8 @@ class MainPresenter(QObject):
             f"Imported {source_file.total_rows:,} rows from {source_file.file_type.upper()} file"
         )
 
-        # Cleanup worker
-        if self.import_worker:
-            self.import_worker.deleteLater()
-            self.import_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.import_worker = None
 
     def _on_import_error(self, error_message: str):
         """
@@ -899,10 +1109,8 @@ class MainPresenter(QObject):
         self.view.object_detail_widget.mapping_widget.show_error(error_message)
         self.view.update_status("Error importing file")
 
-        # Cleanup worker
-        if self.import_worker:
-            self.import_worker.deleteLater()
-            self.import_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.import_worker = None
 
     def _handle_auto_map(self):
         """Handle auto-map request."""
@@ -916,21 +1124,60 @@ class MainPresenter(QObject):
 
         logger.info(f"Auto-mapping fields for {current_object.name}")
 
-        # Generate mapping suggestions
-        suggestions = self.mapping_service.auto_suggest_mappings(
-            source_file,
-            current_object,
-            threshold=0.6
+        # Similarity scoring is O(columns x fields) with per-pair edit
+        # distance (plus optional embedding/LLM calls), so it runs on the
+        # pool; the button is disabled until the result lands
+        mapping_widget.mapping_table.auto_map_button.setEnabled(False)
+        self.view.update_status("Auto-mapping fields...")
+
+        self.auto_map_worker = _TaskRunnable(
+            lambda: self.mapping_service.auto_suggest_mappings(
+                source_file,
+                current_object,
+                threshold=0.6
+            )
         )
+        self.auto_map_worker.signals.finished.connect(self._on_auto_map_done)
+        self.auto_map_worker.signals.error.connect(self._on_auto_map_error)
+        self.pool.start(self.auto_map_worker)
+
+    def _on_auto_map_done(self, suggestions: list):
+        """
+        Apply auto-map suggestions once the worker delivers them.
+
+        Args:
+            suggestions: List of suggested FieldMapping objects
+        """
+        mapping_widget = self.view.object_detail_widget.mapping_widget
 
         # Apply suggestions to the UI
         mapping_widget.set_mappings(suggestions)
+        mapping_widget.mapping_table.auto_map_button.setEnabled(True)
 
         # Update status
         self.view.update_status(
             f"Auto-mapped {len(suggestions)} fields based on name similarity"
         )
 
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.auto_map_worker = None
+
+    def _on_auto_map_error(self, error_message: str):
+        """
+        Handle error during auto-mapping.
+
+        Args:
+            error_message: Error message
+        """
+        logger.error(f"Auto-map failed: {error_message}")
+        mapping_widget = self.view.object_detail_widget.mapping_widget
+        mapping_widget.mapping_table.auto_map_button.setEnabled(True)
+        self.view.update_status("Auto-mapping failed")
+        self.view.show_error("Auto-Map Failed", f"Failed to auto-map fields:\n{error_message}")
+
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.auto_map_worker = None
+
     def _handle_save_mapping(self):
         """Handle save mapping request."""
         from PyQt5.QtWidgets import QFileDialog
@@ -954,12 +1201,13 @@ class MainPresenter(QObject):
         file_path, _ = QFileDialog.getSaveFileName(
             self.view,
             "Save Field Mapping",
-            f"{current_object.name}_mapping.json",
+            os.path.join(self._last_mapping_dir, f"{current_object.name}_mapping.json"),
             "JSON Files (*.json);;All Files (*.*)"
         )
 
         if not file_path:
             return
+        self._last_mapping_dir = os.path.dirname(file_path)
 
         try:
             # Create mapping configuration
@@ -970,9 +1218,8 @@ class MainPresenter(QObject):
                 description=f"Field mapping for {source_file.file_path}"
             )
 
-            # Add mappings
-            for mapping in mappings:
-                config.add_mapping(mapping)
+            # Add mappings (bulk - one dedup pass instead of per-item)
+            config.add_mappings(mappings)
 
             # Save to file
             self.mapping_service.save_mapping(config, file_path)
@@ -1000,12 +1247,13 @@ class MainPresenter(QObject):
         file_path, _ = QFileDialog.getOpenFileName(
             self.view,
             "Load Field Mapping",
-            "",
+            self._last_mapping_dir,
             "JSON Files (*.json);;All Files (*.*)"
         )
 
         if not file_path:
             return
+        self._last_mapping_dir = os.path.dirname(file_path)
 
         try:
             # Load mapping configuration
@@ -1048,12 +1296,13 @@ class MainPresenter(QObject):
         file_path, _ = QFileDialog.getSaveFileName(
             self.view,
             "Save CSV Template",
-            default_filename,
+            os.path.join(self._last_template_dir, default_filename),
             "CSV Files (*.csv);;All Files (*.*)"
         )
 
         if not file_path:
             return  # User cancelled
+        self._last_template_dir = os.path.dirname(file_path)
 
         try:
             # Generate template
@@ -1065,12 +1314,17 @@ class MainPresenter(QObject):
                 include_sample_row=True
             )
 
-            # Count fields included in template
-            createable_required = sum(
-                1 for f in current_object.fields
-                if f.required and f.createable and not getattr(f, 'calculated', False) and not getattr(f, 'auto_number', False)
-            )
-            total_required = sum(1 for f in current_object.fields if f.required)
+            # Count fields included in template in one pass; the flags
+            # bitmask answers required/createable/calculated/auto-number
+            # with one attribute read and two bit tests per field
+            total_required = 0
+            createable_required = 0
+            for f in current_object.fields:
+                flags = f.flags
+                if flags & FIELD_REQUIRED:
+                    total_required += 1
+                    if flags & _TEMPLATE_FIELD_MASK == _TEMPLATE_FIELD_VALUE:
+                        createable_required += 1
 
             # Show success message
             QMessageBox.information(
@@ -1096,7 +1350,7 @@ class MainPresenter(QObject):
     def _handle_filtered_template_download(self):
         """Handle template download for filtered fields (from layout click)."""
         from PyQt5.QtWidgets import QFileDialog, QMessageBox
-        import csv
+        from pathlib import Path
 
         current_object = self.view.object_detail_widget.current_object
         field_table_widget = self.view.object_detail_widget.field_table_widget
@@ -1125,23 +1379,25 @@ class MainPresenter(QObject):
         file_path, _ = QFileDialog.getSaveFileName(
             self.view,
             "Save Filtered CSV Template",
-            default_filename,
+            os.path.join(self._last_template_dir, default_filename),
             "CSV Files (*.csv);;All Files (*.*)"
         )
 
         if not file_path:
             return  # User cancelled
+        self._last_template_dir = os.path.dirname(file_path)
 
         try:
             # Generate CSV with field API names as headers
             logger.info(f"Generating filtered template with {len(displayed_fields)} fields")
 
-            with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-
-                # Write header row with field API names
-                field_names = [field.name for field in displayed_fields]
-                writer.writerow(field_names)
+            # The template is a single header row, so one write_text
+            # beats spinning up csv.writer; names are escaped locally
+            # in case a label-style name sneaks in a comma or quote
+            header = ','.join(
+                _csv_escape(field.name) for field in displayed_fields
+            )
+            Path(file_path).write_text(header + '\r\n', encoding='utf-8')
 
             # Show success message
             layout_info = f" from layout '{field_table_widget.active_filter_layout_name}'" if field_table_widget.active_filter_layout_name else ""
@@ -1183,21 +1439,19 @@ class MainPresenter(QObject):
             self.view.show_error("Load Error", "Please create field mappings before loading data.")
             return
 
-        # Check if required fields are mapped
-        required_fields = [f for f in current_object.fields if f.required]
-        mapped_required = [
-            f for f in required_fields
-            if f.name in [m.target_field for m in mappings]
-        ]
+        # Check if required fields are mapped - one pass over mappings
+        # into a set, then O(1) probes per required field
+        required_fields = current_object.get_required_fields()
+        mapped_targets = {m.target_field for m in mappings}
+        missing = [f for f in required_fields if f.name not in mapped_targets]
 
-        if len(mapped_required) < len(required_fields):
-            missing = [f for f in required_fields if f.name not in [m.target_field for m in mappings]]
+        if missing:
             response = QMessageBox.question(
                 self.view,
                 "Missing Required Fields",
-                f"The following required fields are not mapped:\n\n" +
-                "\n".join([f"• {f.label} ({f.name})" for f in missing]) +
-                f"\n\nDo you want to continue anyway? Records may fail to load.",
+                "The following required fields are not mapped:\n\n" +
+                "\n".join(f"• {f.label} ({f.name})" for f in missing) +
+                "\n\nDo you want to continue anyway? Records may fail to load.",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
@@ -1250,11 +1504,11 @@ class MainPresenter(QObject):
             operation='insert',
             record_type_id=record_type_id
         )
-        self.load_worker.finished.connect(lambda result: self._on_data_loaded(result, progress_dialog))
-        self.load_worker.error.connect(lambda error: self._on_load_data_error(error, progress_dialog))
-        self.load_worker.status.connect(progress_dialog.update_status)  # Connect status updates for Bulk API
-        self.load_worker.progress.connect(progress_dialog.update_progress)  # Connect progress updates
-        self.load_worker.start()
+        self.load_worker.signals.finished.connect(lambda result: self._on_data_loaded(result, progress_dialog))
+        self.load_worker.signals.error.connect(lambda error: self._on_load_data_error(error, progress_dialog))
+        self.load_worker.signals.status.connect(progress_dialog.update_status)  # Connect status updates for Bulk API
+        self.load_worker.signals.progress.connect(progress_dialog.update_progress)  # Connect progress updates
+        self.pool.start(self.load_worker)
 
         self.view.update_status(f"Loading {source_file.total_rows:,} records to Salesforce...")
 
@@ -1277,9 +1531,8 @@ class MainPresenter(QObject):
         # Update progress dialog with completion message
         progress_dialog.set_complete(result.successful_rows, result.failed_rows)
 
-        # Add errors to dialog
-        for error in result.errors:
-            progress_dialog.add_error(error['row'], error['error'])
+        # Add errors to dialog in one batch (single document update)
+        progress_dialog.add_errors(result.errors)
 
         # Update status
         if result.failed_rows == 0:
@@ -1289,10 +1542,8 @@ class MainPresenter(QObject):
                 f"Load complete: {result.successful_rows:,} successful, {result.failed_rows} failed"
             )
 
-        # Cleanup worker
-        if self.load_worker:
-            self.load_worker.deleteLater()
-            self.load_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.load_worker = None
 
     def _on_load_data_error(self, error_message: str, progress_dialog: 'LoadProgressDialog'):
         """
@@ -1310,15 +1561,44 @@ class MainPresenter(QObject):
         # Update status
         self.view.update_status("Error loading data")
 
-        # Cleanup worker
-        if self.load_worker:
-            self.load_worker.deleteLater()
-            self.load_worker = None
+        # Runnable is auto-deleted by the pool; just drop our reference
+        self.load_worker = None
+
+    def _handle_object_hovered(self, object_name: str):
+        """
+        Handle hover over an object in the list (restarts the debounce).
+
+        Args:
+            object_name: API name of the hovered object
+        """
+        self._hovered_object_name = object_name
+        self._prefetch_timer.start()
+
+    def _prefetch_hovered_object(self):
+        """Speculatively warm the describe cache for the hovered object."""
+        object_name = self._hovered_object_name
+        if not object_name:
+            return
+
+        logger.debug(f"Prefetching metadata for hovered object: {object_name}")
+        prefetch_task = _TaskRunnable(
+            lambda: self.metadata_service.get_object_metadata_cached(object_name)
+        )
+        # Result is discarded - the point is the warm cache entry.
+        # QThreadPool.start takes a plain int priority where higher runs
+        # first; negative keeps speculative prefetches behind the
+        # user-triggered tasks queued at the default 0.
+        self.pool.start(prefetch_task, -1)
 
     def _handle_logout(self):
         """Handle logout request."""
         logger.info("Logout requested")
 
+        # Drop session-scoped metadata so a different org/user doesn't
+        # see stale describes or layouts
+        self.metadata_service.flush_cache()
+        self._layout_fields_cache.clear()
+
         # Disconnect from Salesforce
         if self.auth_service.is_connected():
             self.auth_service.disconnect()
@@ -1328,25 +1608,15 @@ class MainPresenter(QObject):
 
     def cleanup(self):
         """Cleanup resources when presenter is no longer needed."""
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
-
-        if self.describe_worker and self.describe_worker.isRunning():
-            self.describe_worker.terminate()
-            self.describe_worker.wait()
-
-        if self.preview_worker and self.preview_worker.isRunning():
-            self.preview_worker.terminate()
-            self.preview_worker.wait()
-
-        if self.import_worker and self.import_worker.isRunning():
-            self.import_worker.terminate()
-            self.import_worker.wait()
-
-        if self.load_worker and self.load_worker.isRunning():
-            self.load_worker.terminate()
-            self.load_worker.wait()
+        # Drop queued runnables; an in-flight load is cancelled
+        # cooperatively and the rest finish on the pool threads
+        self.pool.clear()
+        if self.load_worker is not None:
+            self.load_worker.request_stop()
+        self.worker = None
+        self.preview_worker = None
+        self.import_worker = None
+        self.load_worker = None
 
         if self.auth_service.is_connected():
             self.auth_service.disconnect()
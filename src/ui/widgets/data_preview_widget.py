@@ -5,15 +5,193 @@ Shows a preview of actual data from Salesforce objects.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView,
     QHeaderView, QLabel, QPushButton, QHBoxLayout, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor, QPalette
+from collections import OrderedDict
+from sys import intern
 from typing import List, Dict, Any, Optional
 
 from ...models.salesforce_metadata import SalesforceObject, RecordType
 
+# Rows measured when sizing columns after a load - enough for stable
+# widths without walking the whole result set
+_WIDTH_SAMPLE_ROWS = 50
+
+# Previews kept per (object, record type); toggling back to a
+# recently-viewed record type redisplays without a network round-trip
+_PREVIEW_CACHE_SIZE = 8
+
+# Incremental loading window: the model exposes this many rows up
+# front and pages in further batches as the user scrolls
+_FETCH_INITIAL_ROWS = 200
+_FETCH_BATCH_ROWS = 500
+
+
+def _format_complex(value: Any) -> str:
+    """Format the uncommon cell types (reference dicts, everything else)."""
+    if isinstance(value, dict):
+        # Lookup/reference field - show Name if available
+        if 'Name' in value:
+            return value['Name']
+        # Otherwise show the ID or first available field
+        for key in ['Id', 'name', 'id']:
+            if key in value:
+                return str(value[key])
+    return str(value)
+
+
+# Exact-type dispatch for the common cell types - one dict lookup per
+# cell instead of walking an isinstance ladder
+_FORMATTERS = {
+    type(None): lambda v: "(null)",
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    float: str,
+    str: lambda v: v,
+}
+
+
+def _format_value(value: Any) -> str:
+    """
+    Format a field value for display.
+
+    Args:
+        value: Field value
+
+    Returns:
+        Formatted string
+    """
+    formatter = _FORMATTERS.get(type(value))
+    return formatter(value) if formatter is not None else _format_complex(value)
+
+
+class SalesforceRecordsModel(QAbstractTableModel):
+    """
+    Virtual table model over preview records.
+
+    Holds the record dicts by reference and formats values on demand
+    in data(), so nothing is allocated per cell - Qt only asks for the
+    cells currently visible in the view.
+
+    Rows are exposed incrementally via canFetchMore/fetchMore: the
+    first _FETCH_INITIAL_ROWS are visible immediately and further
+    batches page in as the user scrolls toward the bottom.
+    """
+
+    _NULL_COLOR = QColor('#999')
+    _CELL_ALIGNMENT = int(Qt.AlignLeft | Qt.AlignVCenter)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._records: List[Dict[str, Any]] = []
+        self._fields: List[str] = []
+        # Rows currently exposed to the view (<= len(self._records))
+        self._loaded = 0
+        # Single-cell message shown for loading/error states
+        self._message: Optional[str] = None
+        self._message_color: Optional[QColor] = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._message is not None:
+            return False
+        return self._loaded < len(self._records)
+
+    def fetchMore(self, parent=QModelIndex()):
+        remaining = len(self._records) - self._loaded
+        count = min(_FETCH_BATCH_ROWS, remaining)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else len(self._fields)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        if self._message is not None:
+            return ""
+        if 0 <= section < len(self._fields):
+            return self._fields[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if self._message is not None:
+            if role == Qt.DisplayRole:
+                return self._message
+            if role == Qt.TextAlignmentRole:
+                return int(Qt.AlignCenter)
+            if role == Qt.ForegroundRole and self._message_color is not None:
+                return self._message_color
+            return None
+
+        if role == Qt.DisplayRole:
+            record = self._records[index.row()]
+            return _format_value(record.get(self._fields[index.column()], ''))
+        if role == Qt.TextAlignmentRole:
+            return self._CELL_ALIGNMENT
+        if role == Qt.ForegroundRole:
+            # Grey out null values, same as the old per-item styling
+            record = self._records[index.row()]
+            if record.get(self._fields[index.column()], '') is None:
+                return self._NULL_COLOR
+        return None
+
+    def set_records(self, records: List[Dict[str, Any]], fields: List[str]):
+        """Replace the model contents in a single reset."""
+        self.beginResetModel()
+        self._records = records
+        # Interned names make the per-cell record.get hash lookup in
+        # data() a pointer comparison against the record's own keys
+        self._fields = [intern(f) for f in fields]
+        self._loaded = min(_FETCH_INITIAL_ROWS, len(records))
+        self._message = None
+        self._message_color = None
+        self.endResetModel()
+
+    def append_records(self, records: List[Dict[str, Any]], fields: List[str]):
+        """Append a streamed batch, resetting first if the fields changed."""
+        if self._message is not None or self._fields != fields:
+            self.set_records(list(records), fields)
+            return
+        self._records.extend(records)
+        # Keep the initial window filled; rows past it stay hidden
+        # until the view asks for them via fetchMore
+        target = min(_FETCH_INITIAL_ROWS, len(self._records))
+        if target > self._loaded:
+            self.beginInsertRows(QModelIndex(), self._loaded, target - 1)
+            self._loaded = target
+            self.endInsertRows()
+
+    def record_count(self) -> int:
+        """Total records held, including rows not yet exposed to the view."""
+        return len(self._records)
+
+    def set_message(self, message: str, color: Optional[QColor] = None):
+        """Show a single centered message cell (loading/error states)."""
+        self.beginResetModel()
+        self._records = []
+        self._fields = []
+        self._loaded = 0
+        self._message = message
+        self._message_color = color
+        self.endResetModel()
+
 
 class DataPreviewWidget(QWidget):
     """
@@ -30,6 +208,14 @@ class DataPreviewWidget(QWidget):
         self.current_object: Optional[SalesforceObject] = None
         self.current_data: Optional[Dict[str, Any]] = None  # Store loaded data for export
         self.selected_record_type_id: Optional[str] = None  # Currently selected record type ID
+        # LRU of loaded previews keyed by (object_name, record_type_id)
+        self._preview_cache: OrderedDict = OrderedDict()
+        # (id, name) tuple of the record types currently in the combo,
+        # used to skip rebuilds when the contents would be identical
+        self._combo_cache: Optional[tuple] = None
+        # Signature of the preview currently shown, so a repeated
+        # set_data with the same payload skips the rebuild entirely
+        self._last_sig: Optional[tuple] = None
         self.init_ui()
 
     def init_ui(self):
@@ -42,25 +228,12 @@ class DataPreviewWidget(QWidget):
         record_type_layout = QHBoxLayout()
 
         record_type_label = QLabel("Record Type:")
-        record_type_label.setStyleSheet("font-weight: bold; font-size: 11px;")
+        record_type_label.setObjectName("previewRecordTypeLabel")
         record_type_layout.addWidget(record_type_label)
 
         self.record_type_combo = QComboBox()
+        self.record_type_combo.setObjectName("previewRecordTypeCombo")
         self.record_type_combo.setMinimumWidth(200)
-        self.record_type_combo.setStyleSheet("""
-            QComboBox {
-                padding: 4px 8px;
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QComboBox:hover {
-                border-color: #0176d3;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-        """)
         self.record_type_combo.currentIndexChanged.connect(self._on_record_type_changed)
         record_type_layout.addWidget(self.record_type_combo)
 
@@ -71,15 +244,90 @@ class DataPreviewWidget(QWidget):
         info_layout = QHBoxLayout()
 
         self.info_label = QLabel("No data loaded")
-        self.info_label.setStyleSheet("font-weight: bold; font-size: 12px;")
+        self.info_label.setObjectName("previewInfoLabel")
         info_layout.addWidget(self.info_label)
 
         info_layout.addStretch()
 
         # Load button
         self.load_button = QPushButton("Load Sample Data")
-        self.load_button.setStyleSheet("""
-            QPushButton {
+        self.load_button.setObjectName("previewLoadButton")
+        self.load_button.clicked.connect(self._on_load_clicked)
+        self.load_button.setEnabled(False)
+        info_layout.addWidget(self.load_button)
+
+        # Export button (initially hidden, shown after data is loaded)
+        self.export_button = QPushButton("Export to CSV")
+        self.export_button.setObjectName("previewExportButton")
+        self.export_button.clicked.connect(self._on_export_clicked)
+        self.export_button.setEnabled(False)
+        self.export_button.setVisible(False)  # Hidden until data is loaded
+        info_layout.addWidget(self.export_button)
+
+        layout.addLayout(info_layout)
+
+        # Table - a view over the virtual records model, so cells are
+        # rendered on demand instead of allocated up front
+        self.model = SalesforceRecordsModel(self)
+        self.table = QTableView()
+        self.table.setObjectName("previewTable")
+        self.table.setModel(self.model)
+        self.table.setAlternatingRowColors(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Fixed uniform row heights - without this the view measures
+        # every row during layout and scrolling
+        vertical_header = self.table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(24)
+        vertical_header.setVisible(False)
+        # Header-wide resize settings set once here - the no-index
+        # overload avoids the per-column section signals emitted when
+        # configuring columns individually after each load
+        horizontal_header = self.table.horizontalHeader()
+        horizontal_header.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal_header.setMinimumSectionSize(100)
+        horizontal_header.setDefaultSectionSize(120)
+        horizontal_header.setStretchLastSection(True)
+
+        # Selection colors come from the palette rather than an
+        # ::item:selected stylesheet rule - per-item CSS rules make Qt
+        # run the style engine for every cell paint during scrolling
+        palette = self.table.palette()
+        palette.setColor(QPalette.Highlight, QColor('#0176d3'))
+        palette.setColor(QPalette.HighlightedText, QColor('white'))
+        self.table.setPalette(palette)
+
+        layout.addWidget(self.table)
+
+        self.setLayout(layout)
+
+        # One stylesheet on the widget root, keyed by objectName -
+        # Qt parses the CSS once here instead of once per child, and
+        # child style caches are not invalidated repeatedly during
+        # construction
+        self.setStyleSheet("""
+            QLabel#previewRecordTypeLabel {
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QLabel#previewInfoLabel {
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QComboBox#previewRecordTypeCombo {
+                padding: 4px 8px;
+                border: 1px solid #d0d0d0;
+                border-radius: 4px;
+                background-color: white;
+            }
+            QComboBox#previewRecordTypeCombo:hover {
+                border-color: #0176d3;
+            }
+            QComboBox#previewRecordTypeCombo::drop-down {
+                border: none;
+            }
+            QPushButton#previewLoadButton {
                 background-color: #0176d3;
                 color: white;
                 border: none;
@@ -87,22 +335,10 @@ class DataPreviewWidget(QWidget):
                 border-radius: 4px;
                 font-weight: bold;
             }
-            QPushButton:hover {
+            QPushButton#previewLoadButton:hover {
                 background-color: #014f8e;
             }
-            QPushButton:disabled {
-                background-color: #d0d0d0;
-                color: #666;
-            }
-        """)
-        self.load_button.clicked.connect(self._on_load_clicked)
-        self.load_button.setEnabled(False)
-        info_layout.addWidget(self.load_button)
-
-        # Export button (initially hidden, shown after data is loaded)
-        self.export_button = QPushButton("Export to CSV")
-        self.export_button.setStyleSheet("""
-            QPushButton {
+            QPushButton#previewExportButton {
                 background-color: #2e844a;
                 color: white;
                 border: none;
@@ -110,40 +346,19 @@ class DataPreviewWidget(QWidget):
                 border-radius: 4px;
                 font-weight: bold;
             }
-            QPushButton:hover {
+            QPushButton#previewExportButton:hover {
                 background-color: #1f5a32;
             }
-            QPushButton:disabled {
+            QPushButton#previewLoadButton:disabled,
+            QPushButton#previewExportButton:disabled {
                 background-color: #d0d0d0;
                 color: #666;
             }
-        """)
-        self.export_button.clicked.connect(self._on_export_clicked)
-        self.export_button.setEnabled(False)
-        self.export_button.setVisible(False)  # Hidden until data is loaded
-        info_layout.addWidget(self.export_button)
-
-        layout.addLayout(info_layout)
-
-        # Table
-        self.table = QTableWidget()
-        self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.verticalHeader().setVisible(False)
-        self.table.horizontalHeader().setStretchLastSection(True)
-
-        # Apply styling
-        self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView#previewTable {
                 background-color: white;
                 gridline-color: #e0e0e0;
             }
-            QTableWidget::item:selected {
-                background-color: #0176d3;
-                color: white;
-            }
-            QHeaderView::section {
+            QTableView#previewTable QHeaderView::section {
                 background-color: #f3f3f3;
                 padding: 6px;
                 border: 1px solid #d0d0d0;
@@ -151,10 +366,6 @@ class DataPreviewWidget(QWidget):
             }
         """)
 
-        layout.addWidget(self.table)
-
-        self.setLayout(layout)
-
     def set_object(self, salesforce_object: SalesforceObject):
         """
         Set the object for data preview.
@@ -162,39 +373,59 @@ class DataPreviewWidget(QWidget):
         Args:
             salesforce_object: SalesforceObject instance
         """
-        self.current_object = salesforce_object
-        self.clear()
-
-        # Populate record type dropdown
-        self.record_type_combo.blockSignals(True)  # Prevent triggering change event
-        self.record_type_combo.clear()
+        # Re-selecting the same object (e.g. toggling tabs) leaves the
+        # combo and any loaded preview untouched
+        if self.current_object is salesforce_object:
+            return
 
-        if salesforce_object.record_types:
-            # Add "All Record Types" option
-            self.record_type_combo.addItem("All Record Types", None)
+        self.current_object = salesforce_object
 
-            # Add each record type
-            for record_type in salesforce_object.record_types:
-                self.record_type_combo.addItem(record_type.name, record_type.record_type_id)
+        # Reset preview state for the new object (combo handled below)
+        self.model.set_records([], [])
+        self.current_data = None
+        self._last_sig = None
+        self.export_button.setEnabled(False)
+        self.export_button.setVisible(False)
 
-            # Select first record type by default
-            if len(salesforce_object.record_types) == 1:
-                # If only one record type, select it
-                self.record_type_combo.setCurrentIndex(1)
-                self.selected_record_type_id = salesforce_object.record_types[0].record_type_id
+        new_entries = tuple(
+            (rt.record_type_id, rt.name) for rt in salesforce_object.record_types
+        )
+        if new_entries == self._combo_cache:
+            # Identical contents (commonly two objects with no record
+            # types) - skip the rebuild and keep the current selection
+            self.selected_record_type_id = self.record_type_combo.currentData()
+        else:
+            # Populate record type dropdown
+            self.record_type_combo.blockSignals(True)  # Prevent triggering change event
+            self.record_type_combo.clear()
+
+            if salesforce_object.record_types:
+                # Add "All Record Types" option
+                self.record_type_combo.addItem("All Record Types", None)
+
+                # Add each record type
+                for record_type in salesforce_object.record_types:
+                    self.record_type_combo.addItem(record_type.name, record_type.record_type_id)
+
+                # Select first record type by default
+                if len(salesforce_object.record_types) == 1:
+                    # If only one record type, select it
+                    self.record_type_combo.setCurrentIndex(1)
+                    self.selected_record_type_id = salesforce_object.record_types[0].record_type_id
+                else:
+                    # Multiple record types, start with "All"
+                    self.record_type_combo.setCurrentIndex(0)
+                    self.selected_record_type_id = None
+
+                self.record_type_combo.setEnabled(True)
             else:
-                # Multiple record types, start with "All"
-                self.record_type_combo.setCurrentIndex(0)
+                # No record types
+                self.record_type_combo.addItem("No record types", None)
+                self.record_type_combo.setEnabled(False)
                 self.selected_record_type_id = None
 
-            self.record_type_combo.setEnabled(True)
-        else:
-            # No record types
-            self.record_type_combo.addItem("No record types", None)
-            self.record_type_combo.setEnabled(False)
-            self.selected_record_type_id = None
-
-        self.record_type_combo.blockSignals(False)
+            self.record_type_combo.blockSignals(False)
+            self._combo_cache = new_entries
 
         self.load_button.setEnabled(True)
         self.info_label.setText(f"Select a record type and click 'Load Sample Data' to preview records from {salesforce_object.label}")
@@ -206,16 +437,24 @@ class DataPreviewWidget(QWidget):
         Args:
             data: Dictionary with 'records', 'fields', and 'total_size'
         """
-        # Store data for export
-        self.current_data = data
-
         records = data.get('records', [])
         fields = data.get('fields', [])
         total_size = data.get('total_size', 0)
 
+        # Same payload already on screen (e.g. a double-clicked load
+        # button) - nothing to rebuild
+        sig = (tuple(fields), total_size, len(records), id(records))
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        # Store data for export and remember it for this record type
+        self.current_data = data
+        self._cache_preview(data)
+
         if not records:
             self.info_label.setText("No records found")
-            self.table.setRowCount(0)
+            self.model.set_records([], [])
             self.export_button.setEnabled(False)
             self.export_button.setVisible(False)
             return
@@ -229,59 +468,129 @@ class DataPreviewWidget(QWidget):
         self.export_button.setEnabled(True)
         self.export_button.setVisible(True)
 
-        # Set up table
-        self.table.setRowCount(len(records))
-        self.table.setColumnCount(len(fields))
-        self.table.setHorizontalHeaderLabels(fields)
+        # One model reset replaces the per-cell population loop; the
+        # view pulls only visible cells from the model
+        self.model.set_records(records, fields)
+
+        self._apply_column_widths(records, fields)
+
+    def append_rows(self, data: Dict[str, Any]):
+        """
+        Append a batch of streamed rows to the table.
+
+        Called for each partial chunk while a preview query is still
+        being processed, so the first rows are visible before the full
+        result arrives. finalize_data() completes the render.
+
+        Args:
+            data: Dictionary with 'records' (batch) and 'fields'
+        """
+        records = data.get('records', [])
+        fields = data.get('fields', [])
+
+        if not records:
+            return
+
+        # First batch replaces the loading placeholder; later batches
+        # are a row insertion on the existing model
+        self.model.append_records(records, fields)
+
+        self.info_label.setText(f"Loading... {self.model.record_count()} records")
+
+    def finalize_data(self, data: Dict[str, Any]):
+        """
+        Finish a streamed preview render without repopulating the table.
+
+        Args:
+            data: Dictionary with 'records', 'fields', and 'total_size'
+        """
+        # Store data for export and remember it for this record type
+        self.current_data = data
+        self._cache_preview(data)
+
+        records = data.get('records', [])
+        fields = data.get('fields', [])
+        total_size = data.get('total_size', 0)
 
-        # Populate table
-        for row_idx, record in enumerate(records):
-            for col_idx, field_name in enumerate(fields):
-                value = record.get(field_name, '')
+        # Record what is now on screen so a redundant set_data with
+        # the same payload is skipped
+        self._last_sig = (tuple(fields), total_size, len(records), id(records))
+
+        if not records:
+            self.info_label.setText("No records found")
+            self.model.set_records([], [])
+            self.export_button.setEnabled(False)
+            self.export_button.setVisible(False)
+            return
+
+        self.info_label.setText(
+            f"Showing {len(records)} of {total_size} records"
+        )
 
-                # Format value for display
-                display_value = self._format_value(value)
+        self.export_button.setEnabled(True)
+        self.export_button.setVisible(True)
 
-                # Create table item
-                item = QTableWidgetItem(display_value)
-                item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self._apply_column_widths(records, fields)
 
-                # Color code null values
-                if value is None:
-                    item.setForeground(QColor('#999'))
+    def _apply_column_widths(self, records: List[Dict[str, Any]], fields: List[str]):
+        """
+        Size columns from a sample of rows.
 
-                self.table.setItem(row_idx, col_idx, item)
+        resizeColumnsToContents measures every row in every column,
+        which hangs for seconds on large previews; measuring the first
+        few rows with font metrics gives near-identical widths at
+        O(sample x cols) cost.
 
-        # Resize columns to content
-        self.table.resizeColumnsToContents()
+        Args:
+            records: Loaded records (only the leading sample is measured)
+            fields: Field names, one per column
+        """
+        fm = self.table.fontMetrics()
+        advance = fm.horizontalAdvance
+        sample = records[:_WIDTH_SAMPLE_ROWS]
+
+        # Resize mode and the 100px floor are set header-wide in
+        # init_ui; only the measured width is applied per column
+        getters = [record.get for record in sample]
+        for col, field_name in enumerate(fields):
+            width = advance(field_name)
+            for get in getters:
+                width = max(width, advance(_format_value(get(field_name, ''))))
+            self.table.setColumnWidth(col, width + 20)
+
+    def _cache_preview(self, data: Dict[str, Any]):
+        """
+        Remember loaded preview data for the current object/record type.
 
-        # Set minimum column widths
-        header = self.table.horizontalHeader()
-        for col in range(len(fields)):
-            header.setSectionResizeMode(col, QHeaderView.Interactive)
-            if self.table.columnWidth(col) < 100:
-                self.table.setColumnWidth(col, 100)
+        Args:
+            data: The data dict as passed to set_data/finalize_data
+        """
+        if not self.current_object:
+            return
+        key = (self.current_object.name, self.selected_record_type_id)
+        self._preview_cache[key] = data
+        self._preview_cache.move_to_end(key)
+        while len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
 
     def clear(self):
         """Clear the table."""
-        self.table.setRowCount(0)
-        self.table.setColumnCount(0)
+        self.model.set_records([], [])
         self.info_label.setText("No data loaded")
         self.current_data = None
+        self.current_object = None
         self.selected_record_type_id = None
         self.record_type_combo.clear()
+        self._combo_cache = None
+        self._last_sig = None
         self.export_button.setEnabled(False)
         self.export_button.setVisible(False)
 
     def show_loading(self):
         """Show loading state."""
-        self.table.setRowCount(1)
-        self.table.setColumnCount(1)
-        self.table.setHorizontalHeaderLabels([""])
-        loading_item = QTableWidgetItem("Loading sample data...")
-        loading_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(0, 0, loading_item)
+        self.model.set_message("Loading sample data...")
         self.info_label.setText("Loading...")
+        self._last_sig = None
         self.load_button.setEnabled(False)
 
     def show_error(self, error_message: str):
@@ -291,14 +600,11 @@ class DataPreviewWidget(QWidget):
         Args:
             error_message: Error message to display
         """
-        self.table.setRowCount(1)
-        self.table.setColumnCount(1)
-        self.table.setHorizontalHeaderLabels(["Error"])
-        error_item = QTableWidgetItem(f"Error loading data: {error_message}")
-        error_item.setTextAlignment(Qt.AlignCenter)
-        error_item.setForeground(QColor('#c23934'))
-        self.table.setItem(0, 0, error_item)
+        self.model.set_message(
+            f"Error loading data: {error_message}", QColor('#c23934')
+        )
         self.info_label.setText("Error")
+        self._last_sig = None
         self.load_button.setEnabled(True)
 
     def _on_load_clicked(self):
@@ -314,10 +620,20 @@ class DataPreviewWidget(QWidget):
         # Get the selected record type ID from combo box data
         self.selected_record_type_id = self.record_type_combo.itemData(index)
 
+        # Toggling back to a record type viewed this session redisplays
+        # the cached preview instead of forcing a fresh query
+        if self.current_object:
+            key = (self.current_object.name, self.selected_record_type_id)
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                self._preview_cache.move_to_end(key)
+                self.set_data(cached)
+                return
+
         # Clear existing preview data when record type changes
-        self.table.setRowCount(0)
-        self.table.setColumnCount(0)
+        self.model.set_records([], [])
         self.current_data = None
+        self._last_sig = None
         self.export_button.setEnabled(False)
         self.export_button.setVisible(False)
 
@@ -335,34 +651,3 @@ class DataPreviewWidget(QWidget):
         """
         return self.selected_record_type_id
 
-    def _format_value(self, value: Any) -> str:
-        """
-        Format a field value for display.
-
-        Args:
-            value: Field value
-
-        Returns:
-            Formatted string
-        """
-        if value is None:
-            return "(null)"
-
-        if isinstance(value, bool):
-            return "true" if value else "false"
-
-        if isinstance(value, (int, float)):
-            return str(value)
-
-        if isinstance(value, dict):
-            # Lookup/reference field - show Name if available
-            if 'Name' in value:
-                return value['Name']
-            # Otherwise show the ID or first available field
-            for key in ['Id', 'name', 'id']:
-                if key in value:
-                    return str(value[key])
-            return str(value)
-
-        # Convert to string
-        return str(value)
@@ -13,6 +13,34 @@ from typing import Optional
 
 from ...models.salesforce_metadata import SalesforceField
 
+# Label pairs kept in the reuse pool - one per possible detail row
+# (API name, type, length, required, createable, updateable,
+# relationship, references, picklist values) with headroom
+_DETAIL_POOL_SIZE = 12
+
+
+def _build_value_style(bold_value: bool, value_color: Optional[str]) -> str:
+    """Build the stylesheet string for a detail value label."""
+    style_parts = ["font-size: 13px;"]
+    if bold_value:
+        style_parts.append("font-weight: bold;")
+    style_parts.append(f"color: {value_color or '#333'};")
+    return " ".join(style_parts)
+
+
+# The (bold, color) combinations set_field actually uses - prebuilt so
+# the selection-change path does no string assembly
+_VALUE_STYLE_CACHE = {
+    key: _build_value_style(*key)
+    for key in [
+        (False, None),
+        (True, None),
+        (False, '#c23934'),   # required
+        (False, '#2e844a'),   # not required
+        (False, '#0176d3'),   # references
+    ]
+}
+
 
 class FieldDetailPanel(QWidget):
     """
@@ -59,6 +87,21 @@ class FieldDetailPanel(QWidget):
         self.details_widget.setLayout(self.details_layout)
         self.content_layout.addWidget(self.details_widget)
 
+        # Pre-created label pairs reused across selections - set_field
+        # retexts and shows the rows it needs instead of tearing down
+        # and reallocating widgets on every click
+        self._detail_rows = []
+        for _ in range(_DETAIL_POOL_SIZE):
+            label_widget = QLabel()
+            label_widget.setStyleSheet("color: #666; font-size: 11px;")
+            label_widget.setVisible(False)
+            value_widget = QLabel()
+            value_widget.setWordWrap(True)
+            value_widget.setVisible(False)
+            self.details_layout.addWidget(label_widget)
+            self.details_layout.addWidget(value_widget)
+            self._detail_rows.append((label_widget, value_widget))
+
         self.content_layout.addStretch()
         self.content_widget.setLayout(self.content_layout)
 
@@ -90,90 +133,77 @@ class FieldDetailPanel(QWidget):
         # Update title
         self.title_label.setText(f"{field.label}")
 
-        # Clear existing details
-        self._clear_details()
+        # Collect (label, value, style, multiline) rows, then apply
+        # them to the pooled widgets in one pass
+        rows = []
 
-        # Add field details
-        self._add_detail("API Name", field.name, bold_value=True)
-        self._add_detail("Type", field.type.title())
+        def add(label, value, bold_value=False, value_color=None, multiline=False):
+            rows.append(
+                (label, value, self._value_style(bold_value, value_color), multiline)
+            )
+
+        add("API Name", field.name, bold_value=True)
+        add("Type", field.type.title())
 
         if field.length:
-            self._add_detail("Length", str(field.length))
+            add("Length", str(field.length))
 
         # Required status
         required_text = "Yes" if field.required else "No"
         required_color = "#c23934" if field.required else "#2e844a"
-        self._add_detail("Required", required_text, value_color=required_color)
+        add("Required", required_text, value_color=required_color)
 
         # Createable
-        self._add_detail("Createable", "Yes" if field.createable else "No")
+        add("Createable", "Yes" if field.createable else "No")
 
         # Updateable
-        self._add_detail("Updateable", "Yes" if field.updateable else "No")
+        add("Updateable", "Yes" if field.updateable else "No")
 
         # Relationship info
         if field.relationship_name:
-            self._add_detail("Relationship Name", field.relationship_name)
+            add("Relationship Name", field.relationship_name)
 
         if field.reference_to:
             ref_text = ", ".join(field.reference_to)
-            self._add_detail("References", ref_text, value_color="#0176d3")
+            add("References", ref_text, value_color="#0176d3")
 
         # Picklist values
         if field.picklist_values:
             values_text = "\n".join(f"• {value}" for value in field.picklist_values)
-            self._add_detail("Picklist Values", values_text, multiline=True)
+            add("Picklist Values", values_text, multiline=True)
+
+        self._apply_details(rows)
 
     def clear(self):
         """Clear the panel."""
         self.current_field = None
         self.title_label.setText("Select a field to view details")
-        self._clear_details()
+        self._apply_details([])
 
-    def _clear_details(self):
-        """Clear all detail widgets."""
-        while self.details_layout.count():
-            item = self.details_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    @staticmethod
+    def _value_style(bold_value: bool = False, value_color: Optional[str] = None) -> str:
+        """Get the stylesheet for a detail value label (cached combinations)."""
+        cached = _VALUE_STYLE_CACHE.get((bold_value, value_color))
+        return cached if cached is not None else _build_value_style(bold_value, value_color)
 
-    def _add_detail(self, label: str, value: str, bold_value: bool = False,
-                    value_color: Optional[str] = None, multiline: bool = False):
+    def _apply_details(self, rows):
         """
-        Add a detail row to the panel.
+        Show the given detail rows on the pooled labels.
 
         Args:
-            label: Detail label
-            value: Detail value
-            bold_value: Whether to bold the value
-            value_color: Optional color for the value
-            multiline: Whether this is a multiline value
+            rows: List of (label, value, style, multiline) tuples
         """
-        # Label
-        label_widget = QLabel(label)
-        label_widget.setStyleSheet("color: #666; font-size: 11px;")
-        self.details_layout.addWidget(label_widget)
-
-        # Value
-        value_widget = QLabel(value)
-        value_widget.setWordWrap(True)
-
-        # Styling
-        style_parts = ["font-size: 13px;"]
-        if bold_value:
-            style_parts.append("font-weight: bold;")
-        if value_color:
-            style_parts.append(f"color: {value_color};")
-        else:
-            style_parts.append("color: #333;")
-
-        value_widget.setStyleSheet(" ".join(style_parts))
-
-        if multiline:
-            value_widget.setTextFormat(Qt.PlainText)
-
-        self.details_layout.addWidget(value_widget)
-
-        # Add spacing
-        if not multiline:
-            self.details_layout.addSpacing(5)
+        for (label_widget, value_widget), (label, value, style, multiline) in zip(
+            self._detail_rows, rows
+        ):
+            label_widget.setText(label)
+            value_widget.setText(value)
+            value_widget.setStyleSheet(style)
+            value_widget.setTextFormat(Qt.PlainText if multiline else Qt.AutoText)
+            label_widget.setVisible(True)
+            value_widget.setVisible(True)
+
+        # Hide whatever the current field does not use
+        for label_widget, value_widget in self._detail_rows[len(rows):]:
+            label_widget.setVisible(False)
+            value_widget.setVisible(False)
@@ -244,19 +244,21 @@ class FieldTableWidget(QWidget):
         font.setBold(True)
         return font
 
-    def filter_by_layout_fields(self, layout_field_names: List[str], layout_name: str):
+    def filter_by_layout_fields(self, layout_field_names, layout_name: str):
         """
         Filter fields to show only those on a specific page layout.
 
         Args:
-            layout_field_names: List of field API names on the layout
+            layout_field_names: Iterable of field API names on the layout
             layout_name: Name of the layout for display
         """
         if not self.all_fields:
             # Store all fields for filtering
             self.all_fields = self.fields.copy()
 
-        # Filter fields to only those on the layout
+        # Set membership keeps the scan O(F) rather than O(F x L) when
+        # the caller hands over a list
+        layout_field_names = frozenset(layout_field_names)
         filtered_fields = [f for f in self.all_fields if f.name in layout_field_names]
 
         # Update the display
@@ -5,16 +5,303 @@ Shows source columns with dropdowns to select target Salesforce fields.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QComboBox, QLabel, QHBoxLayout, QPushButton
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView, QStyledItemDelegate,
+    QHeaderView, QComboBox, QCompleter, QLabel, QHBoxLayout, QPushButton,
+    QListView
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QIcon
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QEvent, pyqtSignal
+from PyQt5.QtGui import QColor, QIcon, QStandardItemModel, QStandardItem
+from dataclasses import dataclass
+from sys import intern
 from typing import List, Dict, Optional
 
 from ...models.salesforce_metadata import SalesforceObject, SalesforceField
 from ...models.mapping_models import SourceFile, FieldMapping, MappingConfiguration
 
+# Column order in the mapping table
+COL_SOURCE = 0
+COL_ARROW = 1
+COL_FIELD = 2
+COL_CONFIDENCE = 3
+COL_METHOD = 4
+COL_STATUS = 5
+
+_HEADERS = [
+    "Source Column",
+    "→",
+    "Salesforce Field",
+    "Confidence",
+    "Method",
+    "Status"
+]
+
+
+@dataclass(slots=True)
+class _MappingRow:
+    """Mapping state for one source column, indexed by table row."""
+    target: Optional[str] = None
+    confidence: Optional[float] = None
+    method: Optional[str] = None
+
+
+class MappingTableModel(QAbstractTableModel):
+    """
+    Virtual model over the mapping rows.
+
+    One row per source column; mapping state lives in the dicts handed
+    over by the widget, and the view only asks for the cells currently
+    visible, so nothing is allocated per row up front.
+    """
+
+    # Emitted after an edit through the view changes a mapping
+    mapping_edited = pyqtSignal(str, str)  # source_column, target_field
+
+    _CENTER = int(Qt.AlignCenter)
+    _GREEN = QColor('#2e844a')
+    _ORANGE = QColor('#fe9339')
+    _GRAY = QColor('#666')
+    _UNMAPPED_COLOR = QColor('#999')
+    _METHOD_COLORS = {
+        'llm': QColor('#0176d3'),       # Blue
+        'semantic': QColor('#9050e9'),  # Purple
+        'fuzzy': QColor('#706e6b'),     # Gray
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns: list = []
+        self._row_index: Dict[str, int] = {}  # source_column -> row
+        self._field_display: Dict[str, str] = {}
+        self._rows: List[_MappingRow] = []
+
+    def set_source(
+        self,
+        columns: list,
+        field_display: Dict[str, str],
+        rows: List[_MappingRow],
+    ):
+        """
+        Point the model at the widget's backing state.
+
+        The row-state list is held by reference so widget-side
+        mutations are visible to the model without copying, and cell
+        reads index it directly by table row.
+        """
+        self.beginResetModel()
+        self._columns = columns
+        self._row_index = {col.name: row for row, col in enumerate(columns)}
+        self._field_display = field_display
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return _HEADERS[section]
+        return None
+
+    def flags(self, index):
+        base = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == COL_FIELD:
+            return base | Qt.ItemIsEditable
+        return base
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row_state = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == COL_SOURCE:
+                return self._columns[index.row()].name
+            if col == COL_ARROW:
+                return "→"
+            if col == COL_FIELD:
+                target = row_state.target
+                if not target:
+                    return "(unmapped)"
+                return self._field_display.get(target, target)
+            if col == COL_CONFIDENCE:
+                confidence = row_state.confidence
+                return f"{int(confidence * 100)}%" if confidence is not None else ""
+            if col == COL_METHOD:
+                method = row_state.method
+                return method.upper() if method else ""
+            if col == COL_STATUS:
+                return "✓" if row_state.target else ""
+            return None
+
+        if role == Qt.TextAlignmentRole:
+            if col != COL_SOURCE and col != COL_FIELD:
+                return self._CENTER
+            return None
+
+        if role == Qt.ForegroundRole:
+            if col == COL_FIELD and not row_state.target:
+                return self._UNMAPPED_COLOR
+            if col == COL_CONFIDENCE:
+                confidence = row_state.confidence
+                if confidence is None:
+                    return None
+                if confidence >= 0.9:
+                    return self._GREEN
+                if confidence >= 0.75:
+                    return self._ORANGE
+                return self._GRAY
+            if col == COL_METHOD:
+                if row_state.method:
+                    return self._METHOD_COLORS.get(row_state.method, self._GRAY)
+            if col == COL_STATUS:
+                return self._GREEN
+            return None
+
+        if role == Qt.EditRole and col == COL_FIELD:
+            return row_state.target
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() != COL_FIELD:
+            return False
+
+        row_state = self._rows[index.row()]
+        source_name = self._columns[index.row()].name
+
+        if value:
+            row_state.target = value
+        else:
+            row_state.target = None
+            # Also clear confidence and method when unmapped
+            row_state.confidence = None
+            row_state.method = None
+
+        self.refresh_row(source_name)
+        self.mapping_edited.emit(source_name, value or "")
+        return True
+
+    def refresh_all(self):
+        """Repaint the mapping cells of every row in one signal."""
+        if not self._columns:
+            return
+        self.dataChanged.emit(
+            self.index(0, COL_FIELD),
+            self.index(len(self._columns) - 1, COL_STATUS),
+            [Qt.DisplayRole, Qt.ForegroundRole]
+        )
+
+    def refresh_row(self, source_column: str):
+        """Repaint the mapping cells of the row for a source column."""
+        row = self._row_index.get(source_column)
+        if row is None:
+            return
+        self.dataChanged.emit(
+            self.index(row, COL_FIELD),
+            self.index(row, COL_STATUS),
+            [Qt.DisplayRole, Qt.ForegroundRole]
+        )
+
+
+class _WheelBlocker(QObject):
+    """Event filter that swallows wheel events on the watched widget."""
+
+    def eventFilter(self, obj, event):
+        return event.type() == QEvent.Wheel
+
+
+class SalesforceFieldDelegate(QStyledItemDelegate):
+    """
+    Editor delegate for the Salesforce Field column.
+
+    The combo box is only created when a cell actually enters edit
+    mode, instead of one resident combo per row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One item model shared by every editor instance - populating
+        # a combo is a setModel call instead of O(fields) addItem calls
+        self._field_model = QStandardItemModel(self)
+        # field name -> option model row, so selecting the current
+        # value in setEditorData is a dict hit instead of findData's
+        # linear scan over every field
+        self._row_by_name: Dict[str, int] = {}
+        # Single filter shared by every editor to block wheel scrolls
+        self._wheel_blocker = _WheelBlocker(self)
+
+    def set_field_options(self, options: list):
+        """
+        Rebuild the shared field option model.
+
+        Args:
+            options: List of (display_text, field_name) tuples
+        """
+        self._field_model.clear()
+        self._row_by_name = {}
+        unmapped = QStandardItem("(unmapped)")
+        unmapped.setData(None, Qt.UserRole)
+        self._field_model.appendRow(unmapped)
+        for row, (display_text, field_name) in enumerate(options, start=1):
+            item = QStandardItem(display_text)
+            item.setData(field_name, Qt.UserRole)
+            self._field_model.appendRow(item)
+            self._row_by_name[field_name] = row
+
+    # Dropdown rows laid out per batch while the popup opens
+    _POPUP_BATCH_SIZE = 50
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(self._field_model)
+
+        # Item-view popup with uniform sizes and batched layout, so
+        # opening the dropdown lays out only the visible rows instead
+        # of measuring every field in the org
+        view = QListView(combo)
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.Batched)
+        view.setBatchSize(self._POPUP_BATCH_SIZE)
+        combo.setView(view)
+        # Forces the scrollable item-view popup path (virtualized)
+        # rather than the native full-height menu popup
+        combo.setStyleSheet("QComboBox { combobox-popup: 0; }")
+
+        # Editable with a contains-matching completer, so long field
+        # lists can be narrowed by typing instead of scrolling
+        combo.setEditable(True)
+        combo.setInsertPolicy(QComboBox.NoInsert)
+        completer = combo.completer()
+        completer.setCompletionMode(QCompleter.PopupCompletion)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+
+        # Disable mouse wheel scrolling to prevent accidental changes
+        combo.installEventFilter(self._wheel_blocker)
+        combo.setFocusPolicy(Qt.StrongFocus)
+
+        # Commit as soon as the user picks an entry rather than on
+        # focus-out
+        combo.activated.connect(self._commit_editor)
+        return combo
+
+    def setEditorData(self, editor, index):
+        target = index.data(Qt.EditRole)
+        editor.setCurrentIndex(self._row_by_name.get(target, 0) if target else 0)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentData(), Qt.EditRole)
+
+    def _commit_editor(self):
+        editor = self.sender()
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
 
 class MappingTableWidget(QWidget):
     """
@@ -34,10 +321,14 @@ class MappingTableWidget(QWidget):
         super().__init__()
         self.source_file: Optional[SourceFile] = None
         self.salesforce_object: Optional[SalesforceObject] = None
-        self.mappings: Dict[str, str] = {}  # source_column -> target_field
-        self.confidence_scores: Dict[str, float] = {}  # source_column -> confidence
-        self.mapping_methods: Dict[str, str] = {}  # source_column -> method
-        self.combo_boxes: Dict[str, QComboBox] = {}  # source_column -> combo
+        # One state record per source column, aligned with table rows;
+        # target/confidence/method live together instead of in three
+        # name-keyed dicts probed separately per update
+        self._rows: List[_MappingRow] = []
+        self._row_index: Dict[str, int] = {}  # source_column -> row
+        # Required-field names cached per object so each stats update
+        # is a set intersection, not a rescan of every field
+        self._required_field_names: set = set()
         self.init_ui()
 
     def init_ui(self):
@@ -154,39 +445,43 @@ class MappingTableWidget(QWidget):
         self.stats_label.setStyleSheet("color: #666; font-size: 11px;")
         layout.addWidget(self.stats_label)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Source Column",
-            "→",
-            "Salesforce Field",
-            "Confidence",
-            "Method",
-            "Status"
-        ])
+        # Table - a view over the virtual mapping model; the field
+        # dropdown is built by the delegate only when a cell is edited
+        self.model = MappingTableModel(self)
+        self.model.mapping_edited.connect(self._on_mapping_edited)
+
+        self.field_delegate = SalesforceFieldDelegate(self)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(COL_FIELD, self.field_delegate)
 
         # Configure table
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Single click on the field column opens the dropdown editor
+        self.table.setEditTriggers(
+            QAbstractItemView.CurrentChanged | QAbstractItemView.SelectedClicked
+            | QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed
+        )
         self.table.verticalHeader().setVisible(False)
 
         # Set column widths
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Stretch)  # Source Column
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)  # Arrow
-        header.setSectionResizeMode(2, QHeaderView.Stretch)  # Salesforce Field
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Confidence
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Method
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)  # Status
+        header.setSectionResizeMode(COL_SOURCE, QHeaderView.Stretch)
+        header.setSectionResizeMode(COL_ARROW, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COL_FIELD, QHeaderView.Stretch)
+        header.setSectionResizeMode(COL_CONFIDENCE, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COL_METHOD, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COL_STATUS, QHeaderView.ResizeToContents)
 
         # Apply styling
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: white;
                 gridline-color: #e0e0e0;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0176d3;
                 color: white;
             }
@@ -212,10 +507,19 @@ class MappingTableWidget(QWidget):
         """
         self.source_file = source_file
         self.salesforce_object = salesforce_object
-        self.mappings = {}
-        self.confidence_scores = {}
-        self.mapping_methods = {}
-        self.combo_boxes = {}
+
+        # Interned API names are stored once and make the frequent
+        # required-set and display-map lookups pointer comparisons
+        for sf_field in salesforce_object.fields:
+            sf_field.name = intern(sf_field.name)
+
+        self._rows = [_MappingRow() for _ in source_file.columns]
+        self._row_index = {
+            col.name: row for row, col in enumerate(source_file.columns)
+        }
+        self._required_field_names = {
+            f.name for f in salesforce_object.fields if f.required
+        }
 
         # Enable buttons
         self.auto_map_button.setEnabled(True)
@@ -234,14 +538,47 @@ class MappingTableWidget(QWidget):
         Args:
             mappings: List of FieldMapping objects
         """
+        if not mappings:
+            return
+
+        # Apply the whole batch against the row state with repaints
+        # suspended, then refresh the view and stats once - an
+        # Auto-Map of K columns costs one repaint instead of K
+        self.table.setUpdatesEnabled(False)
+        try:
+            for mapping in mappings:
+                row_idx = self._row_index.get(mapping.source_column)
+                if row_idx is None:
+                    # Saved configs can reference columns absent from
+                    # the currently loaded file
+                    continue
+                row_state = self._rows[row_idx]
+
+                # Store confidence score if available
+                if mapping.confidence is not None:
+                    row_state.confidence = mapping.confidence
+                # Store method if available
+                if mapping.method is not None:
+                    row_state.method = mapping.method
+
+                if mapping.target_field:
+                    # Saved configs carry their own string objects;
+                    # interning re-unifies them with the field names
+                    row_state.target = intern(mapping.target_field)
+                else:
+                    row_state.target = None
+                    row_state.confidence = None
+                    row_state.method = None
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+        self.model.refresh_all()
+        self._update_stats()
+
         for mapping in mappings:
-            # Store confidence score if available
-            if mapping.confidence is not None:
-                self.confidence_scores[mapping.source_column] = mapping.confidence
-            # Store method if available
-            if mapping.method is not None:
-                self.mapping_methods[mapping.source_column] = mapping.method
-            self._apply_mapping(mapping.source_column, mapping.target_field)
+            self.mapping_changed.emit(
+                mapping.source_column, mapping.target_field or ""
+            )
 
     def get_mappings(self) -> List[FieldMapping]:
         """
@@ -251,19 +588,18 @@ class MappingTableWidget(QWidget):
             List of FieldMapping objects
         """
         mappings = []
+        if not self.source_file:
+            return mappings
 
-        for source_col, target_field in self.mappings.items():
-            if target_field:  # Skip unmapped fields
-                # Check if target field is required
-                sf_field = next(
-                    (f for f in self.salesforce_object.fields if f.name == target_field),
-                    None
-                )
-                is_required = sf_field.required if sf_field else False
+        for source_col, row_state in zip(self.source_file.columns, self._rows):
+            if row_state.target:  # Skip unmapped fields
+                # Required-field names are cached in set_data, so this
+                # is a set hit instead of a scan of the field list
+                is_required = row_state.target in self._required_field_names
 
                 mapping = FieldMapping(
-                    source_column=source_col,
-                    target_field=target_field,
+                    source_column=source_col.name,
+                    target_field=row_state.target,
                     mapping_type='direct',
                     is_required=is_required
                 )
@@ -273,13 +609,13 @@ class MappingTableWidget(QWidget):
 
     def clear(self):
         """Clear the table."""
-        self.table.setRowCount(0)
         self.source_file = None
         self.salesforce_object = None
-        self.mappings = {}
-        self.confidence_scores = {}
-        self.mapping_methods = {}
-        self.combo_boxes = {}
+        self._rows = []
+        self._row_index = {}
+        self._required_field_names = set()
+        self.model.set_source([], {}, [])
+        self.field_delegate.set_field_options([])
         self.auto_map_button.setEnabled(False)
         self.save_button.setEnabled(False)
         self.load_button.setEnabled(False)
@@ -291,58 +627,23 @@ class MappingTableWidget(QWidget):
         if not self.source_file or not self.salesforce_object:
             return
 
-        self.table.setRowCount(len(self.source_file.columns))
-
-        for row_idx, source_col in enumerate(self.source_file.columns):
-            # Source column name
-            source_item = QTableWidgetItem(source_col.name)
-            source_item.setFlags(source_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row_idx, 0, source_item)
-
-            # Arrow
-            arrow_item = QTableWidgetItem("→")
-            arrow_item.setTextAlignment(Qt.AlignCenter)
-            arrow_item.setFlags(arrow_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row_idx, 1, arrow_item)
-
-            # Salesforce field dropdown
-            combo = QComboBox()
-            combo.addItem("(unmapped)", None)
-
-            # Add Salesforce fields
-            for sf_field in sorted(self.salesforce_object.fields, key=lambda f: f.label):
-                display_text = f"{sf_field.label} ({sf_field.name})"
-                if sf_field.required:
-                    display_text += " *"
-                combo.addItem(display_text, sf_field.name)
-
-            # Disable mouse wheel scrolling to prevent accidental changes
-            combo.wheelEvent = lambda event: None
-
-            combo.currentIndexChanged.connect(
-                lambda idx, col=source_col.name: self._on_mapping_changed(col, idx)
-            )
-
-            self.table.setCellWidget(row_idx, 2, combo)
-            self.combo_boxes[source_col.name] = combo
-
-            # Confidence percentage
-            confidence_item = QTableWidgetItem("")
-            confidence_item.setTextAlignment(Qt.AlignCenter)
-            confidence_item.setFlags(confidence_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row_idx, 3, confidence_item)
-
-            # Method
-            method_item = QTableWidgetItem("")
-            method_item.setTextAlignment(Qt.AlignCenter)
-            method_item.setFlags(method_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row_idx, 4, method_item)
-
-            # Status icon
-            status_item = QTableWidgetItem("")
-            status_item.setTextAlignment(Qt.AlignCenter)
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row_idx, 5, status_item)
+        # Display text per field, shared by the model and the editor
+        # combo options - built once per set_data, not per row
+        field_display: Dict[str, str] = {}
+        options = []
+        for sf_field in sorted(self.salesforce_object.fields, key=lambda f: f.label):
+            display_text = f"{sf_field.label} ({sf_field.name})"
+            if sf_field.required:
+                display_text += " *"
+            field_display[sf_field.name] = display_text
+            options.append((display_text, sf_field.name))
+
+        self.field_delegate.set_field_options(options)
+        self.model.set_source(
+            self.source_file.columns,
+            field_display,
+            self._rows
+        )
 
     def _apply_mapping(self, source_column: str, target_field: str):
         """
@@ -352,123 +653,60 @@ class MappingTableWidget(QWidget):
             source_column: Source column name
             target_field: Salesforce field API name
         """
-        if source_column not in self.combo_boxes:
+        row_idx = self._row_index.get(source_column)
+        if row_idx is None:
             return
+        row_state = self._rows[row_idx]
 
-        combo = self.combo_boxes[source_column]
-
-        # Find and select the target field
-        for i in range(combo.count()):
-            if combo.itemData(i) == target_field:
-                combo.setCurrentIndex(i)
-                break
-
-        # Update confidence display if available
-        row = list(self.combo_boxes.keys()).index(source_column)
-        confidence_item = self.table.item(row, 3)
-        method_item = self.table.item(row, 4)
-
-        if source_column in self.confidence_scores:
-            confidence = self.confidence_scores[source_column]
-            percentage = int(confidence * 100)
-            confidence_item.setText(f"{percentage}%")
-
-            # Color code based on confidence
-            if confidence >= 0.9:
-                confidence_item.setForeground(QColor('#2e844a'))  # Green
-            elif confidence >= 0.75:
-                confidence_item.setForeground(QColor('#fe9339'))  # Orange
-            else:
-                confidence_item.setForeground(QColor('#666'))  # Gray
-        else:
-            confidence_item.setText("")
-
-        # Update method display if available
-        if source_column in self.mapping_methods:
-            method = self.mapping_methods[source_column]
-            # Format method name for display
-            method_display = method.upper() if method else ""
-            method_item.setText(method_display)
-
-            # Color code based on method
-            if method == 'llm':
-                method_item.setForeground(QColor('#0176d3'))  # Blue
-            elif method == 'semantic':
-                method_item.setForeground(QColor('#9050e9'))  # Purple
-            elif method == 'fuzzy':
-                method_item.setForeground(QColor('#706e6b'))  # Gray
-            else:
-                method_item.setForeground(QColor('#666'))  # Default gray
+        if target_field:
+            row_state.target = intern(target_field)
         else:
-            method_item.setText("")
+            row_state.target = None
+            row_state.confidence = None
+            row_state.method = None
 
-    def _on_mapping_changed(self, source_column: str, combo_index: int):
+        self.model.refresh_row(source_column)
+        self._update_stats()
+        self.mapping_changed.emit(source_column, target_field or "")
+
+    def _on_mapping_edited(self, source_column: str, target_field: str):
         """
-        Handle mapping change from dropdown.
+        Handle a mapping change made through the table editor.
 
         Args:
             source_column: Source column name
-            combo_index: Selected combo box index
+            target_field: Salesforce field API name ("" when unmapped)
         """
-        combo = self.combo_boxes.get(source_column)
-        if not combo:
-            return
-
-        target_field = combo.itemData(combo_index)
-
-        # Update mappings
-        if target_field:
-            self.mappings[source_column] = target_field
-        else:
-            self.mappings.pop(source_column, None)
-
-        # Update status icon
-        row = list(self.combo_boxes.keys()).index(source_column)
-        status_item = self.table.item(row, 5)
-
-        if target_field:
-            status_item.setText("✓")
-            status_item.setForeground(QColor('#2e844a'))
-        else:
-            status_item.setText("")
-            # Also clear confidence and method when unmapped
-            confidence_item = self.table.item(row, 3)
-            confidence_item.setText("")
-            self.confidence_scores.pop(source_column, None)
-
-            method_item = self.table.item(row, 4)
-            method_item.setText("")
-            self.mapping_methods.pop(source_column, None)
-
         # Update stats
         self._update_stats()
 
         # Emit signal
-        self.mapping_changed.emit(source_column, target_field or "")
+        self.mapping_changed.emit(source_column, target_field)
 
     def _update_stats(self):
         """Update mapping statistics."""
         if not self.salesforce_object:
             return
 
-        # Count required fields
-        required_fields = [f for f in self.salesforce_object.fields if f.required]
-        mapped_required = [
-            f for f in required_fields
-            if f.name in self.mappings.values()
-        ]
+        # Count required fields mapped - set intersection against the
+        # names cached in set_data, one pass over the row state
+        mapped_targets = {row.target for row in self._rows if row.target}
+        required_total = len(self._required_field_names)
+        mapped_required = len(
+            self._required_field_names.intersection(mapped_targets)
+        )
 
         # Update label
-        total_mapped = len(self.mappings)
+        total_mapped = sum(1 for row in self._rows if row.target)
         self.stats_label.setText(
             f"{total_mapped} fields mapped • "
-            f"{len(mapped_required)} of {len(required_fields)} required fields mapped"
+            f"{mapped_required} of {required_total} required fields mapped"
         )
 
         # Color code based on required fields
-        if len(mapped_required) == len(required_fields):
+        if mapped_required == required_total:
             self.stats_label.setStyleSheet("color: #2e844a; font-size: 11px; font-weight: bold;")
-        elif len(mapped_required) > 0:
+        elif mapped_required > 0:
             self.stats_label.setStyleSheet("color: #fe9339; font-size: 11px; font-weight: bold;")
         else:
             self.stats_label.setStyleSheet("color: #c23934; font-size: 11px; font-weight: bold;")
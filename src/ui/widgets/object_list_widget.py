@@ -5,15 +5,66 @@ Part of the left panel in the main window.
 """
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QLineEdit, QListWidget,
-    QListWidgetItem, QCheckBox, QHBoxLayout, QLabel
+    QWidget, QVBoxLayout, QLineEdit, QListView,
+    QCheckBox, QHBoxLayout, QLabel
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QSortFilterProxyModel, QTimer, pyqtSignal
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
 from typing import List
 
 from ...models.salesforce_metadata import ObjectListItem
 
 
+class _ObjectFilterProxy(QSortFilterProxyModel):
+    """
+    Filter proxy over the object model.
+
+    Filter changes hide/show existing rows via invalidateFilter
+    instead of destroying and recreating list items per keystroke.
+    Matching runs against the widget's precomputed lowercase index.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: list = []
+        self.search_text = ""
+        self.show_standard = True
+        self.show_custom = True
+
+    def set_entries(self, entries: list):
+        """Point the proxy at the (object, name_lower, label_lower) index."""
+        self._entries = entries
+
+    def set_filter_state(self, search_text: str, show_standard: bool, show_custom: bool):
+        """Update the filter inputs and re-evaluate row visibility."""
+        self.search_text = search_text
+        self.show_standard = show_standard
+        self.show_custom = show_custom
+        self.invalidateFilter()
+
+    def accepts(self, entry) -> bool:
+        """Whether an index entry passes the current filters."""
+        obj, name_lower, label_lower = entry
+        # Check standard/custom filter
+        if obj.custom:
+            if not self.show_custom:
+                return False
+        elif not self.show_standard:
+            return False
+
+        # Check search filter
+        if self.search_text:
+            if self.search_text not in name_lower and self.search_text not in label_lower:
+                return False
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if source_row >= len(self._entries):
+            # Placeholder rows (e.g. the loading message) always show
+            return True
+        return self.accepts(self._entries[source_row])
+
+
 class ObjectListWidget(QWidget):
     """
     Widget for displaying and filtering Salesforce objects.
@@ -23,11 +74,22 @@ class ObjectListWidget(QWidget):
 
     # Signals
     object_selected = pyqtSignal(str)  # object_name
+    object_hovered = pyqtSignal(str)  # object_name (for metadata prefetch)
 
     def __init__(self):
         """Initialize the object list widget."""
         super().__init__()
         self.all_objects: List[ObjectListItem] = []
+        # (object, name_lower, label_lower) presorted by label - the
+        # per-keystroke filter reuses these instead of lowercasing and
+        # re-sorting thousands of strings on every character
+        self._search_index: List[tuple] = []
+        # Coalesces search keystrokes - only the last one in a burst
+        # triggers a refilter
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(120)
+        self._search_timer.timeout.connect(self._update_display)
         self.init_ui()
 
     def init_ui(self):
@@ -65,9 +127,19 @@ class ObjectListWidget(QWidget):
 
         layout.addLayout(filter_layout)
 
-        # Object list
-        self.object_list = QListWidget()
-        self.object_list.itemClicked.connect(self._on_item_clicked)
+        # Object list - persistent item model behind a filter proxy,
+        # so filtering toggles row visibility instead of rebuilding
+        self._source_model = QStandardItemModel(self)
+        self._proxy = _ObjectFilterProxy(self)
+        self._proxy.setSourceModel(self._source_model)
+
+        self.object_list = QListView()
+        self.object_list.setModel(self._proxy)
+        self.object_list.setUniformItemSizes(True)
+        self.object_list.setEditTriggers(QListView.NoEditTriggers)
+        self.object_list.setMouseTracking(True)  # Needed for entered
+        self.object_list.clicked.connect(self._on_item_clicked)
+        self.object_list.entered.connect(self._on_item_entered)
         layout.addWidget(self.object_list)
 
         # Object count label
@@ -85,70 +157,69 @@ class ObjectListWidget(QWidget):
             objects: List of ObjectListItem objects
         """
         self.all_objects = objects
-        self._update_display()
-
-    def _update_display(self):
-        """Update the displayed object list based on filters and search."""
-        self.object_list.clear()
-
-        # Apply filters
-        filtered = []
-        for obj in self.all_objects:
-            # Check standard/custom filter
-            if obj.custom and not self.custom_checkbox.isChecked():
-                continue
-            if not obj.custom and not self.standard_checkbox.isChecked():
-                continue
-
-            # Check search filter
-            search_text = self.search_box.text().lower()
-            if search_text:
-                if search_text not in obj.name.lower() and search_text not in obj.label.lower():
-                    continue
-
-            filtered.append(obj)
-
-        # Sort by label
-        filtered.sort(key=lambda x: x.label)
-
-        # Add to list
-        for obj in filtered:
-            item = QListWidgetItem()
-
-            # Display format: "Account (Standard)" or "Custom_Object__c (Custom)"
-            object_type = "Custom" if obj.custom else "Standard"
-            display_text = f"{obj.label}"
+        self._search_index = sorted(
+            ((obj, obj.name.lower(), obj.label.lower()) for obj in objects),
+            key=lambda entry: entry[2]
+        )
 
-            item.setText(display_text)
-            item.setData(Qt.UserRole, obj.name)  # Store API name
+        # Items built once per load in index (label) order; filtering
+        # only ever hides or shows them
+        self._source_model.clear()
+        for obj, name_lower, label_lower in self._search_index:
+            item = QStandardItem(obj.label)
+            item.setData(obj.name, Qt.UserRole)  # Store API name
+            item.setEditable(False)
 
             # Color code custom objects
             if obj.custom:
                 item.setForeground(Qt.blue)
 
-            self.object_list.addItem(item)
+            self._source_model.appendRow(item)
+
+        self._proxy.set_entries(self._search_index)
+        self._update_display()
+
+    def _update_display(self):
+        """Update the displayed object list based on filters and search."""
+        self._proxy.set_filter_state(
+            self.search_box.text().lower(),
+            self.standard_checkbox.isChecked(),
+            self.custom_checkbox.isChecked()
+        )
 
         # Update count
-        custom_count = sum(1 for o in filtered if o.custom)
-        standard_count = len(filtered) - custom_count
+        total = 0
+        custom_count = 0
+        for entry in self._search_index:
+            if self._proxy.accepts(entry):
+                total += 1
+                if entry[0].custom:
+                    custom_count += 1
+        standard_count = total - custom_count
         self.count_label.setText(
-            f"{len(filtered)} objects ({standard_count} standard, {custom_count} custom)"
+            f"{total} objects ({standard_count} standard, {custom_count} custom)"
         )
 
     def _on_search_changed(self, text: str):
-        """Handle search text change."""
-        self._update_display()
+        """Handle search text change (debounced)."""
+        self._search_timer.start()
 
     def _on_filter_changed(self, state: int):
         """Handle filter checkbox change."""
         self._update_display()
 
-    def _on_item_clicked(self, item: QListWidgetItem):
+    def _on_item_clicked(self, index):
         """Handle object selection."""
-        object_name = item.data(Qt.UserRole)
+        object_name = index.data(Qt.UserRole)
         if object_name:
             self.object_selected.emit(object_name)
 
+    def _on_item_entered(self, index):
+        """Handle mouse hover over an object (drives metadata prefetch)."""
+        object_name = index.data(Qt.UserRole)
+        if object_name:
+            self.object_hovered.emit(object_name)
+
     def clear_selection(self):
         """Clear the current selection."""
         self.object_list.clearSelection()
@@ -161,10 +232,11 @@ class ObjectListWidget(QWidget):
             loading: True to show loading, False to hide
         """
         if loading:
-            self.object_list.clear()
-            item = QListWidgetItem("Loading objects...")
+            self._source_model.clear()
+            self._proxy.set_entries([])
+            item = QStandardItem("Loading objects...")
             item.setFlags(Qt.NoItemFlags)
-            self.object_list.addItem(item)
+            self._source_model.appendRow(item)
             self.search_box.setEnabled(False)
             self.standard_checkbox.setEnabled(False)
             self.custom_checkbox.setEnabled(False)
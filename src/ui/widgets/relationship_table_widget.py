@@ -39,6 +39,7 @@ class RelationshipTableWidget(QWidget):
         self.relationships: List[SalesforceField] = []
         self.current_object_name: Optional[str] = None
         self.record_type_data: Dict[int, tuple] = {}  # Maps row -> (record_type_id, layout_id)
+        self.layout_id_to_name: Dict[str, str] = {}  # Reverse lookup for layout clicks
         self.init_ui()
 
     def init_ui(self):
@@ -205,30 +206,35 @@ class RelationshipTableWidget(QWidget):
             f"{len(salesforce_object.record_types)} Record Types & Page Layouts"
         )
 
-        # Sort by default first, then by name
-        sorted_record_types = sorted(
-            salesforce_object.record_types,
-            key=lambda rt: (not rt.is_default, rt.name)
-        )
+        # Sorted default-first then by name; the cached view on the
+        # object keeps row ordering consistent with the presenter
+        sorted_record_types = salesforce_object.get_record_types_sorted()
 
-        # Add rows
+        # Add rows with repaints and per-item signals frozen - row-by-row
+        # population otherwise re-lays-out the table once per insert
         self.record_type_data.clear()  # Clear previous data
-        for row, record_type in enumerate(sorted_record_types):
-            self.record_types_table.insertRow(row)
-
-            # Store record type ID for this row (layout ID will be stored later)
-            self.record_type_data[row] = (record_type.record_type_id, None)
-
-            # Record Type Name
-            rt_item = QTableWidgetItem(record_type.label)
-            if record_type.is_default:
-                rt_item.setFont(self._get_bold_font())
-            self.record_types_table.setItem(row, 0, rt_item)
-
-            # Page Layout (placeholder - will be loaded)
-            layout_item = QTableWidgetItem("Loading...")
-            layout_item.setForeground(QColor('#888888'))
-            self.record_types_table.setItem(row, 1, layout_item)
+        self.layout_id_to_name.clear()
+        self.record_types_table.setUpdatesEnabled(False)
+        self.record_types_table.blockSignals(True)
+        try:
+            self.record_types_table.setRowCount(len(sorted_record_types))
+            for row, record_type in enumerate(sorted_record_types):
+                # Store record type ID for this row (layout ID will be stored later)
+                self.record_type_data[row] = (record_type.record_type_id, None)
+
+                # Record Type Name
+                rt_item = QTableWidgetItem(record_type.label)
+                if record_type.is_default:
+                    rt_item.setFont(self._get_bold_font())
+                self.record_types_table.setItem(row, 0, rt_item)
+
+                # Page Layout (placeholder - will be loaded)
+                layout_item = QTableWidgetItem("Loading...")
+                layout_item.setForeground(QColor('#888888'))
+                self.record_types_table.setItem(row, 1, layout_item)
+        finally:
+            self.record_types_table.blockSignals(False)
+            self.record_types_table.setUpdatesEnabled(True)
 
         # Request page layout info
         if self.current_object_name:
@@ -270,6 +276,35 @@ class RelationshipTableWidget(QWidget):
                 record_type_id, _ = self.record_type_data[row]
                 self.record_type_data[row] = (record_type_id, layout_id)
 
+            # Keep the reverse lookup in sync so layout clicks resolve
+            # the name in O(1) instead of scanning table items
+            if layout_id:
+                self.layout_id_to_name[layout_id] = layout_name
+
+    def bulk_update_layouts(self, layouts):
+        """
+        Update many rows' page layouts with one repaint.
+
+        Per-row setItem calls each trigger a dataChanged repaint; for
+        objects with hundreds of record types that dominates the
+        handler. Updates and repaints are suspended around the loop so
+        the view invalidates once.
+
+        Args:
+            layouts: Iterable of (row, (layout_name, layout_id)) pairs;
+                a generator works - rows stream through without an
+                intermediate container
+        """
+        table = self.record_types_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for row, (layout_name, layout_id) in layouts:
+                self.update_page_layout_for_row(row, layout_name, layout_id)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
     def set_fields(self, fields: List[SalesforceField]):
         """
         Set the list of all fields and extract relationships.
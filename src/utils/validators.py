@@ -7,6 +7,13 @@ Provides validation functions for user input fields.
 import re
 from typing import Tuple
 
+# Patterns compiled once at import - per-call re.match would hash the
+# pattern string and hit the re module cache on every keystroke.
+# \Z anchors the true end of input (no trailing-newline allowance) and
+# the URL path group is non-capturing since the groups are never read.
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+_URL_RE = re.compile(r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(?:/.*)?\Z')
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -23,13 +30,16 @@ def validate_email(email: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not email or not email.strip():
+    stripped = email.strip() if email else ""
+    if not stripped:
         return False, "Email cannot be empty"
 
-    # Basic email pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    # Cheap reject before the regex - most partial inputs while the
+    # user is still typing lack an @ or a dot in the domain
+    if '@' not in stripped or '.' not in stripped.rpartition('@')[2]:
+        return False, "Invalid email format"
 
-    if re.match(pattern, email.strip()):
+    if _EMAIL_RE.match(stripped):
         return True, ""
     else:
         return False, "Invalid email format"
@@ -102,13 +112,15 @@ def validate_url(url: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not url or not url.strip():
+    stripped = url.strip() if url else ""
+    if not stripped:
         return False, "URL cannot be empty"
 
-    # Basic URL pattern
-    pattern = r'^https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}(/.*)?$'
+    # Cheap reject before the regex
+    if '://' not in stripped:
+        return False, "Invalid URL format (must start with http:// or https://)"
 
-    if re.match(pattern, url.strip()):
+    if _URL_RE.match(stripped):
         return True, ""
     else:
         return False, "Invalid URL format (must start with http:// or https://)"
@@ -126,19 +138,14 @@ def validate_credentials(username: str, password: str, security_token: str) -> T
     Returns:
         Tuple of (is_valid, error_message)
     """
-    # Validate username
-    valid, error = validate_username(username)
-    if not valid:
-        return False, error
-
-    # Validate password
-    valid, error = validate_password(password)
-    if not valid:
-        return False, error
-
-    # Validate security token
-    valid, error = validate_security_token(security_token)
-    if not valid:
-        return False, error
+    checks = (
+        (validate_username, username),
+        (validate_password, password),
+        (validate_security_token, security_token),
+    )
+    for validator, value in checks:
+        valid, error = validator(value)
+        if not valid:
+            return False, error
 
     return True, ""
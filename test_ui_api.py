@@ -30,17 +30,27 @@ headers = {
 }
 
 print(f"\nFetching UI API data from: {url}")
-response = requests.get(url, headers=headers)
-print(f"Status: {response.status_code}")
 
-if response.status_code == 200:
-    data = response.json()
+# Stream the body straight to disk - object-info payloads with many
+# record types/layouts are large, and response.json() + json.dump
+# would hold the whole document in memory twice
+with requests.get(url, headers=headers, stream=True) as response:
+    print(f"Status: {response.status_code}")
+    status_code = response.status_code
+    if status_code == 200:
+        with open("ui_api_response.json", "wb") as f:
+            for chunk in response.iter_content(chunk_size=1024 * 64):
+                f.write(chunk)
+    else:
+        error_text = response.text
 
-    # Save full response for inspection
-    with open("ui_api_response.json", "w") as f:
-        json.dump(data, f, indent=2)
+if status_code == 200:
     print("[OK] Saved full response to ui_api_response.json")
 
+    # Parse once from disk for the structure summary
+    with open("ui_api_response.json", "r") as f:
+        data = json.load(f)
+
     # Print structure summary
     print("\n=== Response Structure ===")
     print(f"Keys: {list(data.keys())}")
@@ -58,4 +68,4 @@ if response.status_code == 200:
             print(f"\n  Layout structure:")
             print(f"    Keys: {list(rt_info['layout'].keys())}")
 else:
-    print(f"Error: {response.text}")
+    print(f"Error: {error_text}")